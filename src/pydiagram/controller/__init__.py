@@ -6,6 +6,7 @@ This module initializes the controller package and imports key classes.
 
 from .commands import (
     Command,
+    CompositeCommand,
     CommandManager
 )
 
@@ -19,6 +20,7 @@ from .diagram_controller import (
 
 __all__ = [
     'Command',
+    'CompositeCommand',
     'CommandManager',
     'AddShapeCommand',
     'RemoveElementCommand',
@@ -5,27 +5,83 @@ This module implements the Command pattern for undo/redo functionality.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Callable
+from collections import deque
+from typing import List, Dict, Any, Optional, Callable, ClassVar, Deque, Tuple
 
 
 class Command(ABC):
     """
     Abstract base class for all commands in the application.
     Implements the Command pattern for undo/redo functionality.
+    
+    Each concrete subclass keeps a free-list of discarded instances so that
+    commands created in interactive loops (e.g. while dragging) can be
+    recycled through acquire()/release() instead of reallocated.
     """
     
-    def __init__(self, description: str = ""):
+    __slots__ = ('_description', '_description_parts')
+    
+    _pool: ClassVar[List['Command']] = []
+    _pool_limit: ClassVar[int] = 64
+    _description_format: ClassVar[str] = "%s"
+    # Every slot of the class, cleared when an instance is released
+    _slot_names: ClassVar[Tuple[str, ...]] = ()
+    
+    def __init_subclass__(cls, **kwargs):
+        """Give every command subclass its own free-list."""
+        super().__init_subclass__(**kwargs)
+        cls._pool = []
+        cls._slot_names = tuple(name for klass in cls.__mro__
+                                for name in klass.__dict__.get('__slots__', ()))
+    
+    @classmethod
+    def acquire(cls, *args, **kwargs) -> 'Command':
+        """
+        Get a command instance, reusing a released one when available.
+        
+        Args:
+            *args: Positional arguments for the command constructor
+            **kwargs: Keyword arguments for the command constructor
+            
+        Returns:
+            An initialized command of this class
+        """
+        if cls._pool:
+            command = cls._pool.pop()
+            command.__init__(*args, **kwargs)
+            return command
+        return cls(*args, **kwargs)
+    
+    def release(self) -> None:
+        """
+        Return the command to its class free-list.
+        The command must not be used again after being released.
+        Its references are cleared first, so pooled commands don't keep
+        pages and elements alive.
+        """
+        for name in self._slot_names:
+            setattr(self, name, None)
+        pool = type(self)._pool
+        if len(pool) < self._pool_limit:
+            pool.append(self)
+    
+    def __init__(self, description: str = "", description_parts: Optional[Tuple[Any, ...]] = None):
         """
         Initialize a new command.
         
         Args:
             description: Human-readable description of the command
+            description_parts: Values for the class description format, used
+                instead of description and only formatted when it is read
         """
         self._description = description
+        self._description_parts = description_parts
     
     @property
     def description(self) -> str:
         """Get the description of the command."""
+        if self._description_parts:
+            return self._description_format % self._description_parts
         return self._description
     
     @abstractmethod
@@ -51,12 +107,72 @@ class Command(ABC):
         Override if a different behavior is needed.
         """
         self.execute()
+    
+    def try_merge(self, other: 'Command') -> bool:
+        """
+        Try to absorb a command executed right after this one.
+        By default, commands are never merged.
+        Override to coalesce repeated operations into a single history entry.
+        
+        Args:
+            other: The command that has just been executed
+            
+        Returns:
+            True if this command now also covers the effects of other
+        """
+        return False
+
+
+class CompositeCommand(Command):
+    """
+    Command grouping several commands into a single undoable step.
+    Sub-commands are executed in order and undone in reverse order.
+    """
+    
+    __slots__ = ('_commands',)
+    
+    def __init__(self, commands: List[Command], description: str = ""):
+        """
+        Initialize a new composite command.
+        
+        Args:
+            commands: The commands to run as one step
+            description: Human-readable description of the command
+        """
+        super().__init__(description)
+        self._commands = tuple(commands)
+    
+    @property
+    def commands(self) -> Tuple[Command, ...]:
+        """Get the grouped commands."""
+        return self._commands
+    
+    def execute(self) -> None:
+        """Execute every grouped command in order."""
+        for command in self._commands:
+            command.execute()
+    
+    def undo(self) -> None:
+        """Undo every grouped command in reverse order."""
+        for command in reversed(self._commands):
+            command.undo()
+    
+    def redo(self) -> None:
+        """Redo every grouped command in order."""
+        for command in self._commands:
+            command.redo()
+    
+    def release(self) -> None:
+        """Return the grouped commands and the composite to their free-lists."""
+        for command in self._commands:
+            command.release()
+        super().release()
 
 
 class CommandManager:
     """
     Manages the execution, undoing, and redoing of commands.
-    Maintains the command history and current position.
+    Maintains the command history as an undo stack and a redo stack.
     """
     
     def __init__(self, max_history: int = 100):
@@ -66,10 +182,11 @@ class CommandManager:
         Args:
             max_history: Maximum number of commands to keep in history
         """
-        self._history: List[Command] = []
-        self._position: int = -1
+        self._undo: Deque[Command] = deque(maxlen=max_history)
+        self._redo: Deque[Command] = deque()
         self._max_history = max_history
-        self._listeners: List[Callable[[str, Command], None]] = []
+        # Insertion-ordered dict used as an ordered set of listeners
+        self._listeners: Dict[Callable[[str, Command], None], None] = {}
     
     def add_listener(self, listener: Callable[[str, Command], None]) -> None:
         """
@@ -78,8 +195,7 @@ class CommandManager:
         Args:
             listener: Callback function that takes event_type and command
         """
-        if listener not in self._listeners:
-            self._listeners.append(listener)
+        self._listeners[listener] = None
     
     def remove_listener(self, listener: Callable[[str, Command], None]) -> None:
         """
@@ -88,8 +204,7 @@ class CommandManager:
         Args:
             listener: The listener to remove
         """
-        if listener in self._listeners:
-            self._listeners.remove(listener)
+        self._listeners.pop(listener, None)
     
     def _notify_listeners(self, event_type: str, command: Command) -> None:
         """
@@ -99,9 +214,24 @@ class CommandManager:
             event_type: Type of event ('execute', 'undo', 'redo')
             command: The command involved
         """
-        for listener in self._listeners:
+        if not self._listeners:
+            return
+        
+        # Iterate over a snapshot so listeners may (un)register themselves
+        for listener in tuple(self._listeners):
             listener(event_type, command)
     
+    @staticmethod
+    def _release_all(commands: Deque[Command]) -> None:
+        """
+        Empty a command stack, recycling every command it held.
+        
+        Args:
+            commands: The stack to empty
+        """
+        while commands:
+            commands.pop().release()
+    
     def execute_command(self, command: Command) -> None:
         """
         Execute a command and add it to the history.
@@ -109,24 +239,27 @@ class CommandManager:
         Args:
             command: The command to execute
         """
-        # If we're not at the end of the history, truncate it
-        if self._position < len(self._history) - 1:
-            self._history = self._history[:self._position + 1]
-        
         # Execute the command
         command.execute()
         
-        # Add to history
-        self._history.append(command)
-        self._position = len(self._history) - 1
+        # A new command invalidates everything that could be redone
+        self._release_all(self._redo)
+        
+        # Coalesce with the last command if it accepts the new one
+        if self._undo and self._undo[-1].try_merge(command):
+            command.release()
+            if self._listeners:
+                self._notify_listeners('execute', self._undo[-1])
+            return
         
-        # Trim history if needed
-        if len(self._history) > self._max_history:
-            self._history = self._history[-self._max_history:]
-            self._position = len(self._history) - 1
+        # Add to history, recycling the oldest command when the stack is full
+        if self._undo and len(self._undo) == self._max_history:
+            self._undo.popleft().release()
+        self._undo.append(command)
         
         # Notify listeners
-        self._notify_listeners('execute', command)
+        if self._listeners:
+            self._notify_listeners('execute', command)
     
     def undo(self) -> bool:
         """
@@ -135,11 +268,12 @@ class CommandManager:
         Returns:
             True if a command was undone, False if there's nothing to undo
         """
-        if self._position >= 0:
-            command = self._history[self._position]
+        if self._undo:
+            command = self._undo.pop()
             command.undo()
-            self._position -= 1
-            self._notify_listeners('undo', command)
+            self._redo.append(command)
+            if self._listeners:
+                self._notify_listeners('undo', command)
             return True
         return False
     
@@ -150,11 +284,12 @@ class CommandManager:
         Returns:
             True if a command was redone, False if there's nothing to redo
         """
-        if self._position < len(self._history) - 1:
-            self._position += 1
-            command = self._history[self._position]
+        if self._redo:
+            command = self._redo.pop()
             command.redo()
-            self._notify_listeners('redo', command)
+            self._undo.append(command)
+            if self._listeners:
+                self._notify_listeners('redo', command)
             return True
         return False
     
@@ -165,7 +300,7 @@ class CommandManager:
         Returns:
             True if there are commands to undo, False otherwise
         """
-        return self._position >= 0
+        return bool(self._undo)
     
     def can_redo(self) -> bool:
         """
@@ -174,7 +309,7 @@ class CommandManager:
         Returns:
             True if there are commands to redo, False otherwise
         """
-        return self._position < len(self._history) - 1
+        return bool(self._redo)
     
     def get_undo_description(self) -> Optional[str]:
         """
@@ -183,9 +318,7 @@ class CommandManager:
         Returns:
             Description of the command or None if there's nothing to undo
         """
-        if self.can_undo():
-            return self._history[self._position].description
-        return None
+        return self._undo[-1].description if self._undo else None
     
     def get_redo_description(self) -> Optional[str]:
         """
@@ -194,11 +327,14 @@ class CommandManager:
         Returns:
             Description of the command or None if there's nothing to redo
         """
-        if self.can_redo():
-            return self._history[self._position + 1].description
-        return None
+        return self._redo[-1].description if self._redo else None
     
     def clear_history(self) -> None:
         """Clear the command history."""
-        self._history.clear()
-        self._position = -1
+        # Recycle the stored commands so they don't keep old models alive
+        self._release_all(self._undo)
+        self._release_all(self._redo)
+        
+        # Start from fresh containers so no grown storage is retained
+        self._undo = deque(maxlen=self._max_history)
+        self._redo = deque()
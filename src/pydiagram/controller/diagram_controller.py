@@ -6,15 +6,20 @@ It handles the high-level operations on diagrams and coordinates
 between the model and view.
 """
 
-from typing import List, Dict, Any, Optional, Tuple, Callable
+from typing import List, Dict, Any, Optional, Tuple, Callable, KeysView
 from ..model import DiagramModel, PageModel, ElementModel, ShapeModel, ConnectorModel, GroupModel
-from .commands import Command, CommandManager
+from .commands import Command, CompositeCommand, CommandManager
 
 
 class AddShapeCommand(Command):
     """Command for adding a shape to a page."""
     
-    def __init__(self, page: PageModel, shape: ShapeModel, description: str = "Add Shape"):
+    __slots__ = ('_page', '_shape', '_index')
+    
+    _description_format = "Add %s"
+    
+    def __init__(self, page: PageModel, shape: ShapeModel, description: str = "Add Shape",
+                 description_parts: Optional[Tuple[Any, ...]] = None):
         """
         Initialize a new add shape command.
         
@@ -22,23 +27,33 @@ class AddShapeCommand(Command):
             page: The page to add the shape to
             shape: The shape to add
             description: Human-readable description of the command
+            description_parts: Values for the "Add %s" description format
         """
-        super().__init__(description)
+        super().__init__(description, description_parts)
         self._page = page
         self._shape = shape
+        self._index: Optional[int] = None
     
     def execute(self) -> None:
         """Execute the command by adding the shape to the page."""
-        self._page.add_element(self._shape)
+        self._index = self._page.add_element(self._shape)
     
     def undo(self) -> None:
         """Undo the command by removing the shape from the page."""
-        self._page.remove_element(self._shape)
+        if self._index is None:
+            # The shape was not added, as its ID was already in use
+            return
+        if self._page.element_at(self._index) is self._shape:
+            self._page.remove_at(self._index)
+        else:
+            self._page.remove_element(self._shape)
 
 
 class RemoveElementCommand(Command):
     """Command for removing an element from a page."""
     
+    __slots__ = ('_page', '_element', '_index')
+    
     def __init__(self, page: PageModel, element: ElementModel, description: str = "Remove Element"):
         """
         Initialize a new remove element command.
@@ -51,21 +66,28 @@ class RemoveElementCommand(Command):
         super().__init__(description)
         self._page = page
         self._element = element
+        self._index: Optional[int] = None
     
     def execute(self) -> None:
         """Execute the command by removing the element from the page."""
-        self._page.remove_element(self._element)
+        self._index = self._page.index_of(self._element)
+        if self._index is not None:
+            self._page.remove_at(self._index)
     
     def undo(self) -> None:
-        """Undo the command by adding the element back to the page."""
-        self._page.add_element(self._element)
+        """Undo the command by adding the element back at its old index."""
+        if self._index is not None:
+            self._page.insert_at(self._index, self._element)
 
 
 class MoveElementCommand(Command):
     """Command for moving an element to a new position."""
     
+    __slots__ = ('_element', '_new_position', '_old_position')
+    
     def __init__(self, element: ElementModel, new_position: Tuple[float, float], 
-                 description: str = "Move Element"):
+                 description: str = "Move Element",
+                 old_position: Optional[Tuple[float, float]] = None):
         """
         Initialize a new move element command.
         
@@ -73,11 +95,12 @@ class MoveElementCommand(Command):
             element: The element to move
             new_position: The new position (x, y)
             description: Human-readable description of the command
+            old_position: The current position (x, y) if already known by the caller
         """
         super().__init__(description)
         self._element = element
         self._new_position = new_position
-        self._old_position = element.position
+        self._old_position = element.position if old_position is None else old_position
     
     def execute(self) -> None:
         """Execute the command by moving the element to the new position."""
@@ -86,11 +109,28 @@ class MoveElementCommand(Command):
     def undo(self) -> None:
         """Undo the command by moving the element back to the old position."""
         self._element.position = self._old_position
+    
+    def try_merge(self, other: Command) -> bool:
+        """
+        Merge a subsequent move of the same element into this command.
+        
+        Args:
+            other: The command that has just been executed
+            
+        Returns:
+            True if the commands were merged, False otherwise
+        """
+        if type(other) is MoveElementCommand and other._element is self._element:
+            self._new_position = other._new_position
+            return True
+        return False
 
 
 class ResizeShapeCommand(Command):
     """Command for resizing a shape."""
     
+    __slots__ = ('_shape', '_new_width', '_new_height', '_old_width', '_old_height')
+    
     def __init__(self, shape: ShapeModel, new_width: float, new_height: float, 
                  description: str = "Resize Shape"):
         """
@@ -116,6 +156,22 @@ class ResizeShapeCommand(Command):
     def undo(self) -> None:
         """Undo the command by restoring the original size."""
         self._shape.set_size(self._old_width, self._old_height)
+    
+    def try_merge(self, other: Command) -> bool:
+        """
+        Merge a subsequent resize of the same shape into this command.
+        
+        Args:
+            other: The command that has just been executed
+            
+        Returns:
+            True if the commands were merged, False otherwise
+        """
+        if type(other) is ResizeShapeCommand and other._shape is self._shape:
+            self._new_width = other._new_width
+            self._new_height = other._new_height
+            return True
+        return False
 
 
 class DiagramController:
@@ -133,7 +189,8 @@ class DiagramController:
         """
         self._diagram = diagram
         self._command_manager = CommandManager()
-        self._selection: List[ElementModel] = []
+        # Insertion-ordered dict used as an ordered set for O(1) membership
+        self._selection: Dict[ElementModel, None] = {}
         self._current_page: Optional[PageModel] = None
         
         # Set the first page as current if available
@@ -163,14 +220,23 @@ class DiagramController:
         Args:
             page: The page to set as current
         """
-        if page in self._diagram.pages:
+        if self._diagram.page_index(page) is not None:
             self._current_page = page
             self.clear_selection()
     
     @property
-    def selection(self) -> List[ElementModel]:
-        """Get the currently selected elements."""
-        return self._selection.copy()
+    def selection(self) -> KeysView[ElementModel]:
+        """Get a live read-only view of the currently selected elements."""
+        return self._selection.keys()
+    
+    def selection_snapshot(self) -> List[ElementModel]:
+        """
+        Get a copy of the currently selected elements.
+        
+        Returns:
+            A new list that is safe to keep while the selection changes
+        """
+        return list(self._selection)
     
     def select_element(self, element: ElementModel) -> None:
         """
@@ -179,8 +245,7 @@ class DiagramController:
         Args:
             element: The element to select
         """
-        if element not in self._selection:
-            self._selection.append(element)
+        self._selection[element] = None
     
     def deselect_element(self, element: ElementModel) -> None:
         """
@@ -189,8 +254,7 @@ class DiagramController:
         Args:
             element: The element to deselect
         """
-        if element in self._selection:
-            self._selection.remove(element)
+        self._selection.pop(element, None)
     
     def clear_selection(self) -> None:
         """Clear the current selection."""
@@ -216,7 +280,7 @@ class DiagramController:
             return None
         
         # Create a unique ID for the shape
-        element_id = f"shape_{len(self._current_page.elements) + 1}"
+        element_id = self._current_page.next_id("shape")
         
         # Create the shape
         shape = ShapeModel(element_id, text, shape_type)
@@ -224,7 +288,8 @@ class DiagramController:
         shape.set_size(width, height)
         
         # Execute the command to add the shape
-        command = AddShapeCommand(self._current_page, shape, f"Add {shape_type}")
+        command = AddShapeCommand.acquire(self._current_page, shape,
+                                          description_parts=(shape_type,))
         self._command_manager.execute_command(command)
         
         return shape
@@ -248,7 +313,7 @@ class DiagramController:
             return None
         
         # Create a unique ID for the connector
-        element_id = f"connector_{len(self._current_page.elements) + 1}"
+        element_id = self._current_page.next_id("connector")
         
         # Create the connector
         connector = ConnectorModel(element_id, text, source_id, target_id)
@@ -259,7 +324,7 @@ class DiagramController:
                 connector.add_waypoint(x, y)
         
         # Execute the command to add the connector
-        command = AddShapeCommand(self._current_page, connector, "Add Connector")
+        command = AddShapeCommand.acquire(self._current_page, connector, "Add Connector")
         self._command_manager.execute_command(command)
         
         return connector
@@ -278,16 +343,54 @@ class DiagramController:
             return False
         
         # Execute the command to remove the element
-        command = RemoveElementCommand(self._current_page, element, "Remove Element")
+        command = RemoveElementCommand.acquire(self._current_page, element, "Remove Element")
         self._command_manager.execute_command(command)
         
         # Deselect the element if it was selected
-        if element in self._selection:
+        self.deselect_element(element)
+        
+        return True
+    
+    def remove_elements(self, elements: List[ElementModel]) -> bool:
+        """
+        Remove several elements from the current page as a single undo step.
+        
+        Args:
+            elements: The elements to remove
+            
+        Returns:
+            True if the elements were removed, False otherwise
+        """
+        if not self._current_page:
+            return False
+        
+        elements = list(elements)
+        if not elements:
+            return False
+        
+        # Execute one composite command for all the elements
+        commands = [RemoveElementCommand.acquire(self._current_page, element, "Remove Element")
+                    for element in elements]
+        command = CompositeCommand.acquire(commands, "Remove Elements")
+        self._command_manager.execute_command(command)
+        
+        # Deselect the removed elements
+        for element in elements:
             self.deselect_element(element)
         
         return True
     
-    def move_element(self, element: ElementModel, x: float, y: float) -> bool:
+    def remove_selection(self) -> bool:
+        """
+        Remove all the selected elements from the current page.
+        
+        Returns:
+            True if the elements were removed, False otherwise
+        """
+        return self.remove_elements(self.selection_snapshot())
+    
+    def move_element(self, element: ElementModel, x: float, y: float,
+                     old_position: Optional[Tuple[float, float]] = None) -> bool:
         """
         Move an element to a new position.
         
@@ -295,12 +398,39 @@ class DiagramController:
             element: The element to move
             x: New X coordinate
             y: New Y coordinate
+            old_position: The current position (x, y) if already known by the caller
             
         Returns:
             True if the element was moved, False otherwise
         """
         # Execute the command to move the element
-        command = MoveElementCommand(element, (x, y), "Move Element")
+        command = MoveElementCommand.acquire(element, (x, y), "Move Element", old_position)
+        self._command_manager.execute_command(command)
+        
+        return True
+    
+    def move_elements(self, elements: List[ElementModel], dx: float, dy: float) -> bool:
+        """
+        Move several elements by the same offset as a single undo step.
+        
+        Args:
+            elements: The elements to move
+            dx: Offset along the X axis
+            dy: Offset along the Y axis
+            
+        Returns:
+            True if the elements were moved, False otherwise
+        """
+        commands = []
+        for element in elements:
+            x, y = element.position
+            commands.append(MoveElementCommand.acquire(element, (x + dx, y + dy), "Move Element", (x, y)))
+        
+        if not commands:
+            return False
+        
+        # Execute one composite command for all the elements
+        command = CompositeCommand.acquire(commands, "Move Elements")
         self._command_manager.execute_command(command)
         
         return True
@@ -321,7 +451,7 @@ class DiagramController:
             return False
         
         # Execute the command to resize the shape
-        command = ResizeShapeCommand(shape, width, height, "Resize Shape")
+        command = ResizeShapeCommand.acquire(shape, width, height, "Resize Shape")
         self._command_manager.execute_command(command)
         
         return True
@@ -370,19 +500,15 @@ class DiagramController:
         Returns:
             True if the page was removed, False otherwise
         """
-        if page in self._diagram.pages:
+        index = self._diagram.page_index(page)
+        if index is not None:
             # If removing the current page, set another page as current
             if page == self._current_page:
-                pages = self._diagram.pages
-                index = pages.index(page)
-                
                 # Try to set the next page as current, or the previous if at the end
-                if index < len(pages) - 1:
-                    self._current_page = pages[index + 1]
-                elif index > 0:
-                    self._current_page = pages[index - 1]
-                else:
-                    self._current_page = None
+                next_page = self._diagram.get_page_by_index(index + 1)
+                if next_page is None:
+                    next_page = self._diagram.get_page_by_index(index - 1)
+                self._current_page = next_page
             
             self._diagram.remove_page(page)
             self.clear_selection()
@@ -1,41 +1,198 @@
 """
-PyDiagram - Integration module for drawpyo extended functionality
+PyDiagram - Integration module for the drawio format
 
-This module provides the integration between PyDiagram and the extended
-drawpyo library, enabling full support for the drawio format.
+This module provides the built-in drawio reader and writer, which convert
+between drawio files and PyDiagram models without depending on drawpyo.
 """
 
 import sys
 import os
-import importlib.util
-import xml.etree.ElementTree as ET
+import base64
+import re
+import zlib
+import functools
+import warnings
+from types import MappingProxyType
+from urllib.parse import unquote
+from xml.sax.saxutils import quoteattr
 from typing import Optional, Dict, Any, List, Tuple
 
-# Add the drawpyo fork to the Python path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'dependencies', 'drawpyo', 'src'))
+try:
+    from lxml import etree as ET
+    _HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _HAS_LXML = False
+    
+    # The pure Python ElementTree is several times slower than the C accelerator
+    if ET.Element is getattr(ET, '_Element_Py', None):
+        warnings.warn("the C accelerator for xml.etree.ElementTree is not available; "
+                      "loading and saving drawio files will be slow", RuntimeWarning)
+
+from ..model import DiagramModel, PageModel, ElementModel, ShapeModel, ConnectorModel, GroupModel
+
+
+# Attributes of every saved mxGraphModel; ElementTree copies them per element
+_MXGRAPHMODEL_ATTRS = {
+    'dx': '1326', 'dy': '798', 'grid': '1', 'gridSize': '10', 'guides': '1',
+    'tooltips': '1', 'connect': '1', 'arrows': '1', 'fold': '1', 'page': '1',
+    'pageScale': '1', 'pageWidth': '850', 'pageHeight': '1100', 'math': '0',
+    'shadow': '0',
+}
+
+# Size of the blocks fed to the XML parser when loading
+_READ_CHUNK_SIZE = 64 * 1024
+
+# IDs and style keys repeat across cells; interning shares one string object
+_intern = sys.intern
+
+# Style tokens that identify a shape type when loading
+_SHAPE_TYPE_FROM_TOKEN = {
+    'ellipse': 'ellipse',
+    'triangle': 'triangle',
+    'rhombus': 'diamond',
+}
+
+# Leading style written for each shape type and for connectors when saving
+_SHAPE_STYLE_PREFIX = {
+    'rectangle': 'rounded=0;whiteSpace=wrap;html=1',
+    'ellipse': 'ellipse;whiteSpace=wrap;html=1',
+    'triangle': 'triangle;whiteSpace=wrap;html=1',
+    'diamond': 'rhombus;whiteSpace=wrap;html=1',
+}
+_CONNECTOR_STYLE_PREFIX_ARROW = 'edgeStyle=orthogonalEdgeStyle;rounded=0;html=1;endArrow=classic'
+_CONNECTOR_STYLE_PREFIX_NOARROW = 'edgeStyle=orthogonalEdgeStyle;rounded=0;html=1;endArrow=none'
+
+
+# A style part: key, optional '=' and the value up to the next semicolon
+_STYLE_PART_RE = re.compile(r'([^;=]*)(=?)([^;]*)')
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_style_cached(style_str: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    Parse a drawio style string into (key, value) pairs.
+    
+    Drawio files reuse a small set of style strings across many cells, so
+    results are cached; the returned tuple is immutable and safe to share.
+    
+    Args:
+        style_str: Style string from drawio
+        
+    Returns:
+        Tuple of (key, value) style pairs, in order of appearance
+    """
+    if not style_str:
+        return ()
+    
+    pairs = []
+    
+    # One scan yields every part as key, '=' marker and value
+    for key, equals, value in _STYLE_PART_RE.findall(style_str):
+        if equals:
+            pairs.append((_intern(key), value))
+        elif key:
+            # Handle flags without values
+            pairs.append((_intern(key), '1'))
+    
+    return tuple(pairs)
+
+
+@functools.lru_cache(maxsize=4096)
+def _shared_style(element_class: type, shape_type: Optional[str], style_str: str) -> MappingProxyType:
+    """
+    Build the complete, read-only style of a loaded element.
+    
+    The element's default style is updated with the parsed style string.
+    Results are cached, so identically styled elements share one mapping.
+    
+    Args:
+        element_class: ShapeModel, ConnectorModel or GroupModel
+        shape_type: Shape type for shapes, None for connectors
+        style_str: The drawio style string
+        
+    Returns:
+        The shared style mapping
+    """
+    if element_class is ShapeModel:
+        style = ShapeModel('', '', shape_type).style
+    else:
+        style = element_class('').style
+    style.update(_parse_style_cached(style_str))
+    return MappingProxyType(style)
+
+
+def _geometry_bounds(geometry: Dict[str, str]) -> Tuple[float, float, float, float]:
+    """
+    Read the bounds of an mxGeometry element.
+    
+    Args:
+        geometry: Attributes of the mxGeometry element
+        
+    Returns:
+        Tuple (x, y, width, height), using the drawio defaults for missing values
+    """
+    get = geometry.get
+    return (float(get('x', '0')), float(get('y', '0')),
+            float(get('width', '100')), float(get('height', '40')))
 
-# Import drawpyo modules
-import drawpyo
-from drawpyo.diagram import BaseDiagram, TreeDiagram
-from drawpyo.reader import DiagramReader, parse_drawio_file
-from drawpyo.writer import DiagramWriter
 
-from ..model import DiagramModel, PageModel, ShapeModel, ConnectorModel, GroupModel
+# (key, value) pairs already covered by each style prefix
+_STYLE_PREFIX_ITEMS = {
+    prefix: frozenset(_parse_style_cached(prefix))
+    for prefix in (*_SHAPE_STYLE_PREFIX.values(),
+                   _CONNECTOR_STYLE_PREFIX_ARROW, _CONNECTOR_STYLE_PREFIX_NOARROW)
+}
+
+
+# Style keys written through the prefix rather than as key=value pairs
+_HANDLED_STYLE_KEYS = frozenset(('shape', 'endArrow'))
+
+
+@functools.lru_cache(maxsize=2048)
+def _style_string(prefix: Optional[str], style_items: Tuple[Tuple[str, str], ...]) -> str:
+    """
+    Build a drawio style string from a prefix and an element's style properties.
+    
+    Results are cached by value, so identically styled elements share one string.
+    
+    Args:
+        prefix: Shape- or connector-specific style prefix, or None
+        style_items: The element's style properties as (key, value) pairs
+        
+    Returns:
+        Style string for drawio
+    """
+    style_parts = [prefix] if prefix else []
+    prefix_items = _STYLE_PREFIX_ITEMS.get(prefix, frozenset())
+    
+    # Add common style properties
+    for key, value in style_items:
+        # Skip properties already handled or already set by the prefix
+        if key in _HANDLED_STYLE_KEYS or (key, value) in prefix_items:
+            continue
+            
+        style_parts.append(f"{key}={value}")
+    
+    return ';'.join(style_parts)
 
 
 class DrawpyoIntegration:
     """
-    Integration class for the extended drawpyo functionality.
+    Integration class for drawio files.
     
-    This class provides methods to convert between PyDiagram models and
-    drawpyo objects, enabling seamless integration with the extended
-    drawpyo library.
+    This class provides methods to load drawio files into PyDiagram models
+    and to save models as drawio files. The XML is parsed and written
+    directly, with lxml when available and ElementTree otherwise.
     """
     
     @staticmethod
     def load_drawio_file(file_path: str) -> Optional[DiagramModel]:
         """
-        Load a drawio file using the extended drawpyo library.
+        Load a drawio file.
+        
+        The file is fed in chunks to an XML parser whose target builds the
+        model directly from the parse events, so no XML tree is kept in memory.
         
         Args:
             file_path: Path to the drawio file
@@ -44,12 +201,6 @@ class DrawpyoIntegration:
             A DiagramModel object or None if loading failed
         """
         try:
-            # Use the drawpyo reader to parse the file
-            drawio_content = parse_drawio_file(file_path)
-            
-            if not drawio_content:
-                return None
-            
             # Create a new diagram model
             diagram_name = os.path.basename(file_path)
             if diagram_name.endswith('.drawio'):
@@ -57,108 +208,14 @@ class DrawpyoIntegration:
                 
             diagram = DiagramModel(diagram_name)
             
-            # Process each page in the drawio file
-            for page_idx, page_content in enumerate(drawio_content):
-                page_name = page_content.get('name', f"Page {page_idx + 1}")
-                page = PageModel(page_name)
-                diagram.add_page(page)
-                
-                # Process the mxGraphModel content
-                graph_model = page_content.get('content')
-                if not graph_model:
-                    continue
-                
-                # Find the root element
-                root_elem = graph_model.find('root')
-                if not root_elem:
-                    continue
-                
-                # Process all mxCell elements
-                cells = {}
-                for cell_elem in root_elem.findall('mxCell'):
-                    cell_id = cell_elem.get('id')
-                    if not cell_id:
-                        continue
-                    
-                    cells[cell_id] = cell_elem
-                
-                # First pass: Create all elements
-                for cell_id, cell_elem in cells.items():
-                    # Skip special cells (0 and 1 are reserved)
-                    if cell_id in ['0', '1']:
-                        continue
-                    
-                    # Determine if this is a vertex (shape) or edge (connector)
-                    is_vertex = cell_elem.get('vertex') == '1'
-                    is_edge = cell_elem.get('edge') == '1'
-                    
-                    if is_vertex:
-                        # Create a shape
-                        value = cell_elem.get('value', '')
-                        style = cell_elem.get('style', '')
-                        
-                        # Determine shape type from style
-                        shape_type = 'rectangle'  # Default
-                        if 'ellipse' in style:
-                            shape_type = 'ellipse'
-                        elif 'triangle' in style:
-                            shape_type = 'triangle'
-                        elif 'rhombus' in style:
-                            shape_type = 'diamond'
-                        
-                        # Create the shape
-                        shape = ShapeModel(cell_id, value, shape_type)
-                        
-                        # Set style properties
-                        style_props = DrawpyoIntegration._parse_style(style)
-                        for key, value in style_props.items():
-                            shape.set_style(key, value)
-                        
-                        # Set geometry
-                        geometry_elem = cell_elem.find('mxGeometry')
-                        if geometry_elem is not None:
-                            x = float(geometry_elem.get('x', '0'))
-                            y = float(geometry_elem.get('y', '0'))
-                            width = float(geometry_elem.get('width', '100'))
-                            height = float(geometry_elem.get('height', '40'))
-                            
-                            shape.position = (x, y)
-                            shape.set_size(width, height)
-                        
-                        # Add to page
-                        page.add_element(shape)
-                    
-                    elif is_edge:
-                        # Create a connector
-                        value = cell_elem.get('value', '')
-                        style = cell_elem.get('style', '')
-                        source = cell_elem.get('source')
-                        target = cell_elem.get('target')
-                        
-                        # Create the connector
-                        connector = ConnectorModel(cell_id, value, source, target)
-                        
-                        # Set style properties
-                        style_props = DrawpyoIntegration._parse_style(style)
-                        for key, value in style_props.items():
-                            connector.set_style(key, value)
-                        
-                        # Set geometry and waypoints
-                        geometry_elem = cell_elem.find('mxGeometry')
-                        if geometry_elem is not None:
-                            # Set position
-                            x = float(geometry_elem.get('x', '0'))
-                            y = float(geometry_elem.get('y', '0'))
-                            connector.position = (x, y)
-                            
-                            # Add waypoints
-                            for point_elem in geometry_elem.findall('mxPoint'):
-                                px = float(point_elem.get('x', '0'))
-                                py = float(point_elem.get('y', '0'))
-                                connector.add_waypoint(px, py)
-                        
-                        # Add to page
-                        page.add_element(connector)
+            parser = _make_parser(_DrawioTarget(diagram))
+            with open(file_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(_READ_CHUNK_SIZE), b''):
+                    parser.feed(chunk)
+            parser.close()
+            
+            if not diagram.pages:
+                return None
             
             return diagram
         
@@ -166,10 +223,228 @@ class DrawpyoIntegration:
             print(f"Error loading drawio file: {e}")
             return None
     
+    @staticmethod
+    def _decode_diagram_text(text: str) -> bytes:
+        """
+        Decode the text content of a drawio diagram element.
+        
+        Args:
+            text: Either escaped mxGraphModel XML or the deflated, base64
+                encoded form drawio uses for compressed files
+            
+        Returns:
+            The mxGraphModel XML document, UTF-8 encoded
+        """
+        text = text.strip()
+        if not text.startswith('<'):
+            data = zlib.decompress(base64.b64decode(text), -zlib.MAX_WBITS)
+            text = unquote(data.decode('utf-8'))
+        return text.encode('utf-8')
+    
+    @staticmethod
+    def _add_cell(page: PageModel, attrib: Dict[str, str],
+                  geometry: Optional[Dict[str, str]],
+                  points: List[Tuple[float, float]]) -> Optional[ElementModel]:
+        """
+        Create the model element described by an mxCell and add it to a page.
+        
+        Args:
+            page: The page to add the element to
+            attrib: Attributes of the mxCell
+            geometry: Attributes of its mxGeometry, or None if it has none
+            points: Waypoints read from the mxGeometry
+            
+        Returns:
+            The element added to the page, or None if the cell was skipped
+        """
+        cell_id = attrib.get('id')
+        
+        # Skip special cells (0 and 1 are reserved)
+        if not cell_id or cell_id in ('0', '1'):
+            return None
+        cell_id = _intern(cell_id)
+        
+        # Determine if this is a vertex (group or shape) or edge (connector)
+        if attrib.get('vertex') == '1':
+            style = attrib.get('style')
+            if style and ('group', '1') in _parse_style_cached(style):
+                element = DrawpyoIntegration._build_group(cell_id, attrib, geometry)
+            else:
+                element = DrawpyoIntegration._build_shape(cell_id, attrib, geometry)
+        elif attrib.get('edge') == '1':
+            element = DrawpyoIntegration._build_connector(cell_id, attrib, geometry, points)
+        else:
+            return None
+        
+        if page.add_element(element) is None:
+            return None
+        return element
+    
+    @staticmethod
+    def _build_group(cell_id: str, attrib: Dict[str, str],
+                     geometry: Optional[Dict[str, str]]) -> GroupModel:
+        """
+        Create a group from a vertex mxCell with the group style.
+        
+        Args:
+            cell_id: ID of the cell
+            attrib: Attributes of the mxCell
+            geometry: Attributes of its mxGeometry, or None if it has none
+            
+        Returns:
+            The new group, without children; they are attached once the page is read
+        """
+        group = GroupModel(cell_id, attrib.get('value', ''))
+        group.adopt_style(_shared_style(GroupModel, None, attrib['style']))
+        
+        if geometry is not None:
+            geometry_get = geometry.get
+            group.position = (float(geometry_get('x', '0')), float(geometry_get('y', '0')))
+        
+        return group
+    
+    @staticmethod
+    def _attach_children(page: PageModel, nested: List[Tuple[ElementModel, str]]) -> None:
+        """
+        Add elements read inside a group cell to their group.
+        
+        Drawio stores the geometry of a group's children relative to the
+        group, so they are also moved to absolute page coordinates.
+        
+        Args:
+            page: The page holding the elements
+            nested: Each element with the ID of its parent cell, in document order
+        """
+        parent_of = {element.id: parent_id for element, parent_id in nested}
+        
+        # Work out every offset from the positions as read, before moving anything
+        moves = []
+        for element, parent_id in nested:
+            group = page.get_element_by_id(parent_id)
+            if not isinstance(group, GroupModel):
+                # Other layers are not modelled; the geometry is already absolute
+                continue
+            
+            offset_x = offset_y = 0.0
+            ancestor_id = parent_id
+            seen = set()
+            while ancestor_id is not None and ancestor_id not in seen:
+                ancestor = page.get_element_by_id(ancestor_id)
+                if not isinstance(ancestor, GroupModel):
+                    break
+                seen.add(ancestor_id)
+                ancestor_x, ancestor_y = ancestor.position
+                offset_x += ancestor_x
+                offset_y += ancestor_y
+                ancestor_id = parent_of.get(ancestor_id)
+            moves.append((element, group, offset_x, offset_y))
+        
+        for element, group, offset_x, offset_y in moves:
+            group.add_child(element.id)
+            element.parent_id = group.id
+            if offset_x or offset_y:
+                x, y = element.position
+                element.position = (x + offset_x, y + offset_y)
+                if isinstance(element, ConnectorModel):
+                    for index, (wx, wy) in enumerate(element.waypoints):
+                        element.set_waypoint(index, wx + offset_x, wy + offset_y)
+    
+    @staticmethod
+    def _build_shape(cell_id: str, attrib: Dict[str, str],
+                     geometry: Optional[Dict[str, str]]) -> ShapeModel:
+        """
+        Create a shape from a vertex mxCell.
+        
+        Args:
+            cell_id: ID of the cell
+            attrib: Attributes of the mxCell
+            geometry: Attributes of its mxGeometry, or None if it has none
+            
+        Returns:
+            The new shape
+        """
+        get = attrib.get
+        value = get('value', '')
+        style = get('style')
+        style_pairs = _parse_style_cached(style) if style else ()
+        
+        # Determine shape type from the style tokens
+        shape_type = 'rectangle'  # Default
+        for key, token in style_pairs:
+            if key != 'shape':
+                token = key
+            token_shape_type = _SHAPE_TYPE_FROM_TOKEN.get(token)
+            if token_shape_type is not None:
+                shape_type = token_shape_type
+                break
+        
+        # Create the shape
+        shape = ShapeModel(cell_id, value, shape_type)
+        
+        # Share the style with identically styled shapes
+        if style:
+            shape.adopt_style(_shared_style(ShapeModel, shape_type, style))
+        
+        # Set geometry
+        if geometry is not None:
+            x, y, width, height = _geometry_bounds(geometry)
+            shape.position = (x, y)
+            shape.set_size(width, height)
+        
+        return shape
+    
+    @staticmethod
+    def _build_connector(cell_id: str, attrib: Dict[str, str], geometry: Optional[Dict[str, str]],
+                         points: List[Tuple[float, float]]) -> ConnectorModel:
+        """
+        Create a connector from an edge mxCell.
+        
+        Args:
+            cell_id: ID of the cell
+            attrib: Attributes of the mxCell
+            geometry: Attributes of its mxGeometry, or None if it has none
+            points: Waypoints read from the mxGeometry
+            
+        Returns:
+            The new connector
+        """
+        get = attrib.get
+        value = get('value', '')
+        style = get('style')
+        
+        source = get('source')
+        target = get('target')
+        
+        # Create the connector
+        connector = ConnectorModel(cell_id, value,
+                                   _intern(source) if source else None,
+                                   _intern(target) if target else None)
+        
+        # Share the style with identically styled connectors
+        if style:
+            connector.adopt_style(_shared_style(ConnectorModel, None, style))
+        
+        # Set geometry and waypoints
+        if geometry is not None:
+            # Set position
+            geometry_get = geometry.get
+            connector.position = (float(geometry_get('x', '0')), float(geometry_get('y', '0')))
+            
+            # Add waypoints
+            for px, py in points:
+                connector.add_waypoint(px, py)
+        
+        return connector
+    
     @staticmethod
     def save_drawio_file(diagram: DiagramModel, file_path: str) -> bool:
         """
-        Save a diagram to a drawio file using the extended drawpyo library.
+        Save a diagram to a drawio file.
+        
+        The file is written incrementally: the XML tree of a single page is
+        built and serialized straight into the file before the next page is
+        processed, with its mxGraphModel stored as a child element of the
+        diagram element rather than as escaped text.
         
         Args:
             diagram: The diagram model to save
@@ -179,102 +454,26 @@ class DrawpyoIntegration:
             True if saving was successful, False otherwise
         """
         try:
-            # Create the mxfile element
-            mxfile = ET.Element('mxfile')
-            mxfile.set('host', 'PyDiagram')
-            mxfile.set('modified', '2025-03-27T07:30:00.000Z')
-            mxfile.set('agent', 'PyDiagram/1.0')
-            mxfile.set('version', '14.6.13')
-            mxfile.set('etag', 'PyDiagram-' + diagram.id)
-            mxfile.set('type', 'device')
+            mxfile_attrs = (
+                ('host', 'PyDiagram'),
+                ('modified', '2025-03-27T07:30:00.000Z'),
+                ('agent', 'PyDiagram/1.0'),
+                ('version', '14.6.13'),
+                ('etag', 'PyDiagram-' + diagram.name),
+                ('type', 'device'),
+            )
+            start_tag = '<mxfile' + ''.join(f' {key}={quoteattr(value)}' for key, value in mxfile_attrs) + '>'
             
-            # Add each page as a diagram element
-            for page_idx, page in enumerate(diagram.pages):
-                diagram_elem = ET.SubElement(mxfile, 'diagram')
-                diagram_elem.set('id', f"page-{page_idx}")
-                diagram_elem.set('name', page.name)
-                
-                # Create the mxGraphModel
-                graph_model = ET.Element('mxGraphModel')
-                graph_model.set('dx', '1326')
-                graph_model.set('dy', '798')
-                graph_model.set('grid', '1')
-                graph_model.set('gridSize', '10')
-                graph_model.set('guides', '1')
-                graph_model.set('tooltips', '1')
-                graph_model.set('connect', '1')
-                graph_model.set('arrows', '1')
-                graph_model.set('fold', '1')
-                graph_model.set('page', '1')
-                graph_model.set('pageScale', '1')
-                graph_model.set('pageWidth', '850')
-                graph_model.set('pageHeight', '1100')
-                graph_model.set('math', '0')
-                graph_model.set('shadow', '0')
-                
-                # Create the root element
-                root = ET.SubElement(graph_model, 'root')
-                
-                # Add default cells (0 and 1)
-                cell0 = ET.SubElement(root, 'mxCell')
-                cell0.set('id', '0')
+            with open(file_path, 'wb') as f:
+                f.write(b"<?xml version='1.0' encoding='utf-8'?>\n")
+                f.write(start_tag.encode('utf-8'))
                 
-                cell1 = ET.SubElement(root, 'mxCell')
-                cell1.set('id', '1')
-                cell1.set('parent', '0')
+                # Write each page as a diagram element
+                for page_idx, page in enumerate(diagram.pages):
+                    diagram_elem = DrawpyoIntegration._build_page(page_idx, page)
+                    ET.ElementTree(diagram_elem).write(f, encoding='utf-8', xml_declaration=False)
                 
-                # Add each element
-                for element in page.elements:
-                    if isinstance(element, ShapeModel):
-                        # Create a shape cell
-                        cell = ET.SubElement(root, 'mxCell')
-                        cell.set('id', element.id)
-                        cell.set('value', element.value)
-                        cell.set('style', DrawpyoIntegration._generate_style(element))
-                        cell.set('parent', '1')
-                        cell.set('vertex', '1')
-                        
-                        # Add geometry
-                        geometry = ET.SubElement(cell, 'mxGeometry')
-                        x, y = element.position
-                        geometry.set('x', str(x))
-                        geometry.set('y', str(y))
-                        geometry.set('width', str(element.width))
-                        geometry.set('height', str(element.height))
-                        geometry.set('as', 'geometry')
-                    
-                    elif isinstance(element, ConnectorModel):
-                        # Create a connector cell
-                        cell = ET.SubElement(root, 'mxCell')
-                        cell.set('id', element.id)
-                        cell.set('value', element.value)
-                        cell.set('style', DrawpyoIntegration._generate_style(element))
-                        cell.set('parent', '1')
-                        cell.set('edge', '1')
-                        
-                        if element.source_id:
-                            cell.set('source', element.source_id)
-                        if element.target_id:
-                            cell.set('target', element.target_id)
-                        
-                        # Add geometry with waypoints
-                        geometry = ET.SubElement(cell, 'mxGeometry')
-                        geometry.set('relative', '1')
-                        geometry.set('as', 'geometry')
-                        
-                        # Add waypoints
-                        for wx, wy in element.waypoints:
-                            point = ET.SubElement(geometry, 'mxPoint')
-                            point.set('x', str(wx))
-                            point.set('y', str(wy))
-                
-                # Convert mxGraphModel to string and add to diagram element
-                graph_model_str = ET.tostring(graph_model, encoding='utf-8').decode('utf-8')
-                diagram_elem.text = graph_model_str
-            
-            # Write to file
-            tree = ET.ElementTree(mxfile)
-            tree.write(file_path, encoding='utf-8', xml_declaration=True)
+                f.write(b'</mxfile>')
             
             return True
         
@@ -283,37 +482,68 @@ class DrawpyoIntegration:
             return False
     
     @staticmethod
-    def _parse_style(style_str: str) -> Dict[str, str]:
+    def _build_page(page_idx: int, page: PageModel):
         """
-        Parse a drawio style string into a dictionary.
+        Build the diagram element for a page.
         
         Args:
-            style_str: Style string from drawio
+            page_idx: Index of the page in the diagram
+            page: The page to convert
             
         Returns:
-            Dictionary of style properties
+            The diagram XML element, holding the page's mxGraphModel
         """
-        style_dict = {}
+        diagram_elem = ET.Element('diagram')
+        diagram_elem.set('id', f"page-{page_idx}")
+        diagram_elem.set('name', page.name)
         
-        if not style_str:
-            return style_dict
+        # Create the mxGraphModel
+        graph_model = ET.SubElement(diagram_elem, 'mxGraphModel', _MXGRAPHMODEL_ATTRS)
         
-        # Split by semicolons
-        parts = style_str.split(';')
+        # Create the root element
+        root = ET.SubElement(graph_model, 'root')
         
-        for part in parts:
-            if not part:
-                continue
-            
-            # Check if it's a key=value pair
-            if '=' in part:
-                key, value = part.split('=', 1)
-                style_dict[key] = value
-            else:
-                # Handle flags without values
-                style_dict[part] = '1'
+        # Add default cells (0 and 1)
+        cell0 = ET.SubElement(root, 'mxCell')
+        cell0.set('id', '0')
+        
+        cell1 = ET.SubElement(root, 'mxCell')
+        cell1.set('id', '1')
+        cell1.set('parent', '0')
+        
+        # Children of a group are stored in the group cell, relative to it
+        parent_groups: Dict[str, GroupModel] = {}
+        for element in page.elements:
+            if type(element) is GroupModel:
+                for child_id in element.children_ids:
+                    parent_groups[child_id] = element
         
-        return style_dict
+        # Build every element's cell, then attach them in one call
+        cells = []
+        for element in page.elements:
+            cell_builder = _CELL_BUILDERS.get(type(element))
+            if cell_builder is not None:
+                group = parent_groups.get(element.id)
+                if group is None:
+                    cells.append(cell_builder(element))
+                else:
+                    cells.append(cell_builder(element, group.id, group.position))
+        root.extend(cells)
+        
+        return diagram_elem
+    
+    @staticmethod
+    def _parse_style(style_str: str) -> Dict[str, str]:
+        """
+        Parse a drawio style string into a dictionary.
+        
+        Args:
+            style_str: Style string from drawio
+            
+        Returns:
+            Dictionary of style properties
+        """
+        return dict(_parse_style_cached(style_str))
     
     @staticmethod
     def _generate_style(element) -> str:
@@ -326,44 +556,299 @@ class DrawpyoIntegration:
         Returns:
             Style string for drawio
         """
-        style_parts = []
-        
-        # Add shape-specific style
+        # Start from the precomputed shape- or connector-specific prefix
+        prefix = None
         if isinstance(element, ShapeModel):
-            if element.shape_type == 'rectangle':
-                style_parts.append('rounded=0')
-                style_parts.append('whiteSpace=wrap')
-                style_parts.append('html=1')
-            elif element.shape_type == 'ellipse':
-                style_parts.append('ellipse')
-                style_parts.append('whiteSpace=wrap')
-                style_parts.append('html=1')
-            elif element.shape_type == 'triangle':
-                style_parts.append('triangle')
-                style_parts.append('whiteSpace=wrap')
-                style_parts.append('html=1')
-            elif element.shape_type == 'diamond':
-                style_parts.append('rhombus')
-                style_parts.append('whiteSpace=wrap')
-                style_parts.append('html=1')
-        
+            prefix = _SHAPE_STYLE_PREFIX.get(element.shape_type)
         elif isinstance(element, ConnectorModel):
-            style_parts.append('edgeStyle=orthogonalEdgeStyle')
-            style_parts.append('rounded=0')
-            style_parts.append('html=1')
-            
-            # Add arrow style
             if element.get_style('endArrow', 'none') != 'none':
-                style_parts.append('endArrow=classic')
+                prefix = _CONNECTOR_STYLE_PREFIX_ARROW
             else:
-                style_parts.append('endArrow=none')
+                prefix = _CONNECTOR_STYLE_PREFIX_NOARROW
         
-        # Add common style properties
-        for key, value in element.style.items():
-            # Skip properties already handled
-            if key in ['shape', 'endArrow']:
-                continue
-                
-            style_parts.append(f"{key}={value}")
+        # Elements sharing a style reuse the same cached string
+        return _style_string(prefix, tuple(element.style.items()))
+
+
+class _DrawioTarget:
+    """
+    XML parser target that builds a DiagramModel from drawio parse events.
+    
+    Only the attributes of the mxCell being read (and of its geometry) are
+    kept; each cell is turned into a model element when it closes.
+    """
+    
+    def __init__(self, diagram: DiagramModel, page: Optional[PageModel] = None):
+        """
+        Initialize a new drawio parser target.
+        
+        Args:
+            diagram: The diagram to add pages to
+            page: Page receiving the cells, for documents without diagram elements
+        """
+        self._diagram = diagram
+        self._page = page
+        self._page_has_cells = False
+        self._tags: List[str] = []
+        self._text: List[str] = []
+        self._cell: Optional[Dict[str, str]] = None
+        self._geometry: Optional[Dict[str, str]] = None
+        self._points: List[Tuple[float, float]] = []
+        # Elements whose parent cell is not the default layer, with that parent's ID
+        self._nested: List[Tuple[ElementModel, str]] = []
+    
+    def start(self, tag: str, attrib: Dict[str, str]) -> None:
+        """Handle an opening tag."""
+        parent = self._tags[-1] if self._tags else None
+        self._tags.append(tag)
+        
+        if tag == 'mxCell':
+            self._cell = dict(attrib)
+            self._geometry = None
+            self._points = []
+        elif self._cell is None:
+            if tag == 'diagram':
+                # Each diagram element is a page
+                page_name = attrib.get('name') or f"Page {len(self._diagram.pages) + 1}"
+                self._page = PageModel(page_name)
+                self._diagram.add_page(self._page)
+                self._page_has_cells = False
+                self._text = []
+        elif tag == 'mxGeometry' and parent == 'mxCell' and self._geometry is None:
+            self._geometry = dict(attrib)
+        elif tag == 'mxPoint' and parent == 'mxGeometry':
+            get = attrib.get
+            self._points.append((float(get('x', '0')), float(get('y', '0'))))
+    
+    def end(self, tag: str) -> None:
+        """Handle a closing tag."""
+        self._tags.pop()
         
-        return ';'.join(style_parts)
+        if tag == 'mxCell':
+            # Plain mxGraphModel files have no diagram wrapper
+            if self._page is None:
+                self._page = PageModel("Page 1")
+                self._diagram.add_page(self._page)
+            
+            element = DrawpyoIntegration._add_cell(self._page, self._cell, self._geometry, self._points)
+            parent_id = self._cell.get('parent')
+            if element is not None and parent_id not in (None, '0', '1'):
+                self._nested.append((element, parent_id))
+            self._page_has_cells = True
+            self._cell = None
+        
+        elif tag == 'root':
+            # Every cell of the page is known: resolve the group children
+            if self._nested and self._page is not None:
+                DrawpyoIntegration._attach_children(self._page, self._nested)
+            self._nested = []
+        
+        elif tag == 'diagram':
+            # Pages saved as (possibly compressed) text content
+            text = ''.join(self._text)
+            if not self._page_has_cells and text.strip():
+                graph_model_xml = DrawpyoIntegration._decode_diagram_text(text)
+                parser = _make_parser(_DrawioTarget(self._diagram, self._page))
+                parser.feed(graph_model_xml)
+                parser.close()
+            
+            self._page = None
+            self._text = []
+    
+    def data(self, data: str) -> None:
+        """Collect the text content of diagram elements."""
+        if self._tags and self._tags[-1] == 'diagram':
+            self._text.append(data)
+    
+    def close(self) -> DiagramModel:
+        """Finish parsing and return the diagram."""
+        return self._diagram
+
+
+def _make_parser(target: _DrawioTarget):
+    """
+    Create an XML parser feeding the given target.
+    
+    With lxml the parser refuses huge trees and network access; the standard
+    library parser does not resolve external entities. Neither loads a DTD,
+    and the predefined entities (&amp;, &lt;, ...) are decoded as usual.
+    
+    Args:
+        target: The parser target
+        
+    Returns:
+        The XML parser
+    """
+    if _HAS_LXML:
+        return ET.XMLParser(target=target, huge_tree=False, no_network=True,
+                            remove_blank_text=True, collect_ids=False)
+    return ET.XMLParser(target=target)
+
+
+def _fmt(value: float) -> str:
+    """
+    Format a coordinate compactly without losing precision.
+    
+    Whole numbers are written without a fractional part; other values use
+    the shortest representation that round-trips.
+    
+    Args:
+        value: The coordinate
+        
+    Returns:
+        The formatted coordinate
+    """
+    value = float(value)
+    if value.is_integer() and abs(value) < 1e16:
+        return str(int(value))
+    return repr(value)
+
+
+def _mkcell(attrib: Dict[str, str], children=()):
+    """
+    Create an mxCell element with all its attributes and children at once.
+    
+    Args:
+        attrib: Attributes of the cell
+        children: Child elements of the cell
+        
+    Returns:
+        The mxCell XML element
+    """
+    cell = ET.Element('mxCell', attrib)
+    cell.extend(children)
+    return cell
+
+
+def _shape_cell(element: ShapeModel, parent: str = '1', origin: Tuple[float, float] = (0, 0)):
+    """
+    Create the mxCell for a shape.
+    
+    Args:
+        element: The shape
+        parent: ID of the parent cell
+        origin: Position of the parent cell, subtracted from the shape's
+        
+    Returns:
+        The mxCell XML element
+    """
+    # x and y default to 0 in drawio
+    x, y = element.position
+    x -= origin[0]
+    y -= origin[1]
+    geometry_attrib = {}
+    if x:
+        geometry_attrib['x'] = _fmt(x)
+    if y:
+        geometry_attrib['y'] = _fmt(y)
+    geometry_attrib['width'] = _fmt(element.width)
+    geometry_attrib['height'] = _fmt(element.height)
+    geometry_attrib['as'] = 'geometry'
+    geometry = ET.Element('mxGeometry', geometry_attrib)
+    
+    return _mkcell({'id': element.id, 'value': element.value,
+                    'style': DrawpyoIntegration._generate_style(element),
+                    'parent': parent, 'vertex': '1'}, (geometry,))
+
+
+def _connector_cell(element: ConnectorModel, parent: str = '1',
+                    origin: Tuple[float, float] = (0, 0)):
+    """
+    Create the mxCell for a connector.
+    
+    Args:
+        element: The connector
+        parent: ID of the parent cell
+        origin: Position of the parent cell, subtracted from the waypoints
+        
+    Returns:
+        The mxCell XML element
+    """
+    # Add geometry with waypoints, formatting each coordinate array in one pass
+    geometry = ET.Element('mxGeometry', {'relative': '1', 'as': 'geometry'})
+    if element.waypoint_count:
+        xs, ys = element.waypoint_arrays()
+        origin_x, origin_y = origin
+        if origin_x or origin_y:
+            xs = [wx - origin_x for wx in xs]
+            ys = [wy - origin_y for wy in ys]
+        geometry.extend([ET.Element('mxPoint', {'x': wx, 'y': wy})
+                         for wx, wy in zip(map(_fmt, xs), map(_fmt, ys))])
+    
+    attrib = {'id': element.id, 'value': element.value,
+              'style': DrawpyoIntegration._generate_style(element),
+              'parent': parent, 'edge': '1'}
+    if element.source_id:
+        attrib['source'] = element.source_id
+    if element.target_id:
+        attrib['target'] = element.target_id
+    
+    return _mkcell(attrib, (geometry,))
+
+
+def _group_extent(group: GroupModel, seen: set) -> Tuple[float, float]:
+    """
+    Get the bottom right corner of the shapes in a group and its nested groups.
+    
+    Args:
+        group: The group
+        seen: IDs of the groups already visited, to stop on cycles
+        
+    Returns:
+        Tuple (max_x, max_y), or the group position if it holds no shapes
+    """
+    seen.add(group.id)
+    max_x, max_y = group.position
+    for child in group.children():
+        if isinstance(child, ShapeModel):
+            child_x, child_y = child.position
+            max_x = max(max_x, child_x + child.width)
+            max_y = max(max_y, child_y + child.height)
+        elif isinstance(child, GroupModel) and child.id not in seen:
+            child_max_x, child_max_y = _group_extent(child, seen)
+            max_x = max(max_x, child_max_x)
+            max_y = max(max_y, child_max_y)
+    return max_x, max_y
+
+
+def _group_cell(element: GroupModel, parent: str = '1', origin: Tuple[float, float] = (0, 0)):
+    """
+    Create the mxCell for a group.
+    
+    Args:
+        element: The group
+        parent: ID of the parent cell
+        origin: Position of the parent cell, subtracted from the group's
+        
+    Returns:
+        The mxCell XML element
+    """
+    # The group cell spans its child shapes, including those of nested groups
+    group_x, group_y = element.position
+    max_x, max_y = _group_extent(element, set())
+    width = max(0, max_x - group_x)
+    height = max(0, max_y - group_y)
+    
+    x = group_x - origin[0]
+    y = group_y - origin[1]
+    geometry_attrib = {}
+    if x:
+        geometry_attrib['x'] = _fmt(x)
+    if y:
+        geometry_attrib['y'] = _fmt(y)
+    geometry_attrib['width'] = _fmt(width)
+    geometry_attrib['height'] = _fmt(height)
+    geometry_attrib['as'] = 'geometry'
+    geometry = ET.Element('mxGeometry', geometry_attrib)
+    
+    return _mkcell({'id': element.id, 'value': element.value,
+                    'style': DrawpyoIntegration._generate_style(element),
+                    'parent': parent, 'vertex': '1', 'connectable': '0'}, (geometry,))
+
+
+# mxCell builder for each savable element type, looked up by exact type
+_CELL_BUILDERS = {
+    ShapeModel: _shape_cell,
+    ConnectorModel: _connector_cell,
+    GroupModel: _group_cell,
+}
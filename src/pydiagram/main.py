@@ -2,16 +2,10 @@
 PyDiagram - Main application module
 
 This module provides the entry point for the PyDiagram application,
-integrating the extended drawpyo functionality with the PyQt5 GUI.
+integrating the diagram model and drawio support with the PyQt5 GUI.
 """
 
 import sys
-import os
-from PyQt5.QtWidgets import QApplication
-
-from .view import MainWindow
-from .model import DiagramModel
-from .controller import DiagramController
 
 
 def main():
@@ -21,6 +15,10 @@ def main():
     This function initializes the application, creates the main window,
     and starts the event loop.
     """
+    # Import the GUI here so non-GUI users of the package don't load Qt
+    from PyQt5.QtWidgets import QApplication
+    from .view import MainWindow
+    
     # Create application
     app = QApplication(sys.argv)
     
@@ -2,11 +2,50 @@
 PyDiagram - Módulo de modelo base
 
 Este módulo define las clases base para el modelo de datos de PyDiagram.
-Utiliza drawpyo ampliado como base para la representación de diagramas.
+Los diagramas se leen y se guardan en formato drawio con el lector y
+escritor propios del paquete de integración.
 """
 
+import re
+import sys
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Tuple
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Tuple, Mapping, Iterator, Iterable, FrozenSet, Callable
+
+
+# Las claves y valores cortos de estilo se repiten en muchos elementos
+_intern = sys.intern
+_INTERN_MAX_LENGTH = 32
+
+
+def _intern_style_value(value: Any) -> Any:
+    """
+    Internaliza un valor de estilo si es una cadena corta.
+    
+    Args:
+        value: Valor de estilo
+        
+    Returns:
+        El valor, internalizado si procede
+    """
+    if type(value) is str and len(value) < _INTERN_MAX_LENGTH:
+        return _intern(value)
+    return value
+
+
+# Marca de clave ausente, distinta de un valor None almacenado
+_MISSING = object()
+
+# Par clave=valor de un string de estilo drawio
+_STYLE_PAIR_RE = re.compile(r'([^;=]+)=([^;]*)')
+
+
+# Cambios que se agrupan en una sola notificación dentro de un lote
+_COALESCED_CHANGES = frozenset((
+    'name_changed', 'value_changed', 'position_changed', 'rotation_changed',
+    'parent_changed', 'style_changed', 'property_changed', 'metadata_changed',
+))
 
 
 class ModelObserver:
@@ -33,19 +72,40 @@ class BaseModel(ABC):
     Implementa el patrón Observer para notificar cambios.
     """
     
+    __slots__ = ('_observers', '_observers_by_type', '_observers_any', '_notify_depth',
+                 '_pending_notifications', '__weakref__')
+    
     def __init__(self):
         """Inicializa un nuevo modelo base."""
-        self._observers: List[ModelObserver] = []
-    
-    def add_observer(self, observer: ModelObserver) -> None:
+        # Observadores registrados, en orden, con sus intereses, nivel y
+        # función de notificación
+        self._observers: Dict[ModelObserver, Tuple[Optional[FrozenSet[str]], int, Callable]] = {}
+        # Funciones de notificación de cada tipo de cambio, y de los tipos sin
+        # interesados. Son tuplas que se sustituyen (nunca se modifican) al
+        # añadir o eliminar observadores, así que se pueden recorrer sin copiarlas
+        self._observers_by_type: Dict[str, Tuple[Tuple[Callable, int], ...]] = {}
+        self._observers_any: Tuple[Tuple[Callable, int], ...] = ()
+        # Notificaciones retenidas mientras los observadores están bloqueados
+        self._notify_depth = 0
+        self._pending_notifications: List[Tuple[str, Any, int]] = []
+    
+    def add_observer(self, observer: ModelObserver, interests: Optional[Iterable[str]] = None,
+                     level: int = 0, callback: Optional[Callable[['BaseModel', str, Any], None]] = None) -> None:
         """
         Añade un observador al modelo.
         
         Args:
             observer: El observador a añadir
+            interests: Tipos de cambio que le interesan, o None para todos
+            level: Nivel mínimo de las notificaciones que recibe
+            callback: Función llamada con (modelo, tipo de cambio, datos);
+                por defecto, el método model_changed del observador
         """
-        if observer not in self._observers:
-            self._observers.append(observer)
+        if callback is None:
+            callback = observer.model_changed
+        self._observers[observer] = (frozenset(interests) if interests is not None else None,
+                                     level, callback)
+        self._rebuild_dispatch()
     
     def remove_observer(self, observer: ModelObserver) -> None:
         """
@@ -54,19 +114,115 @@ class BaseModel(ABC):
         Args:
             observer: El observador a eliminar
         """
-        if observer in self._observers:
-            self._observers.remove(observer)
+        if self._observers.pop(observer, None) is not None:
+            self._rebuild_dispatch()
+    
+    def _rebuild_dispatch(self) -> None:
+        """Reconstruye las listas de observadores por tipo de cambio."""
+        registrations = self._observers.values()
+        change_types = set()
+        for interests, _, _ in registrations:
+            if interests is not None:
+                change_types |= interests
+        
+        self._observers_any = tuple((callback, level) for interests, level, callback in registrations
+                                    if interests is None)
+        self._observers_by_type = {
+            change_type: tuple((callback, level) for interests, level, callback in registrations
+                               if interests is None or change_type in interests)
+            for change_type in change_types
+        }
     
-    def notify_observers(self, change_type: str, data: Any = None) -> None:
+    def notify_observers(self, change_type: str, data: Any = None, level: int = 0) -> None:
         """
-        Notifica a todos los observadores de un cambio en el modelo.
+        Notifica a los observadores interesados de un cambio en el modelo.
+        
+        Los setters más frecuentes comprueban self._observers antes de
+        llamar, para no construir los datos del cambio si nadie escucha.
         
         Args:
             change_type: Tipo de cambio
             data: Datos adicionales sobre el cambio
+            level: Nivel de la notificación; no se avisa a los observadores
+                registrados con un nivel superior
         """
-        for observer in self._observers:
-            observer.model_changed(self, change_type, data)
+        if not self._observers:
+            return
+        if self._notify_depth:
+            self._pending_notifications.append((change_type, data, level))
+            return
+        # La tupla capturada no cambia aunque un observador se dé de baja
+        callbacks = self._observers_by_type.get(change_type, self._observers_any)
+        for callback, observer_level in callbacks:
+            if observer_level <= level:
+                callback(self, change_type, data)
+    
+    def lock_observers(self) -> None:
+        """
+        Retiene las notificaciones hasta la llamada a unlock_observers.
+        
+        Los bloqueos se pueden anidar.
+        """
+        self._notify_depth += 1
+    
+    def unlock_observers(self) -> None:
+        """
+        Libera un bloqueo y, al liberar el último, envía las notificaciones
+        retenidas, agrupando los cambios repetidos.
+        """
+        self._notify_depth -= 1
+        if self._notify_depth == 0 and self._pending_notifications:
+            pending = self._pending_notifications
+            self._pending_notifications = []
+            for change_type, data, level in self._coalesce_notifications(pending):
+                self.notify_observers(change_type, data, level)
+    
+    @contextmanager
+    def batch_notifications(self) -> Iterator['BaseModel']:
+        """
+        Agrupa las notificaciones emitidas dentro del bloque with.
+        
+        Returns:
+            Un gestor de contexto que devuelve el propio modelo
+        """
+        self.lock_observers()
+        try:
+            yield self
+        finally:
+            self.unlock_observers()
+    
+    @staticmethod
+    def _coalesce_notifications(pending: List[Tuple[str, Any, int]]) -> List[Tuple[str, Any, int]]:
+        """
+        Agrupa las notificaciones repetidas de un mismo cambio.
+        
+        Se conserva la última, en su posición, con los valores 'old_*'
+        de la primera.
+        
+        Args:
+            pending: Notificaciones retenidas, en orden de emisión
+            
+        Returns:
+            Las notificaciones que se deben enviar
+        """
+        result: List[Optional[Tuple[str, Any, int]]] = []
+        positions: Dict[Tuple[str, Any], int] = {}
+        
+        for change_type, data, level in pending:
+            if change_type in _COALESCED_CHANGES and isinstance(data, dict):
+                key = (change_type, data.get('key'))
+                index = positions.get(key)
+                if index is not None:
+                    first = result[index][1]
+                    data = dict(data)
+                    for name, value in first.items():
+                        if name.startswith('old_'):
+                            data[name] = value
+                    result[index] = None
+                positions[key] = len(result)
+            result.append((change_type, data, level))
+        
+        return [notification for notification in result if notification is not None]
 
 
 class DiagramModel(BaseModel):
@@ -75,6 +231,8 @@ class DiagramModel(BaseModel):
     Un diagrama puede contener múltiples páginas.
     """
     
+    __slots__ = ('_name', '_pages', '_page_index', '_pages_by_name', '_pages_view', '_metadata')
+    
     def __init__(self, name: str = "Untitled Diagram"):
         """
         Inicializa un nuevo diagrama.
@@ -85,6 +243,11 @@ class DiagramModel(BaseModel):
         super().__init__()
         self._name = name
         self._pages: List[PageModel] = []
+        self._page_index: Dict[PageModel, int] = {}
+        # Índice de páginas por nombre, reconstruido bajo demanda
+        self._pages_by_name: Optional[Dict[str, PageModel]] = None
+        # Vista inmutable de las páginas, reconstruida tras cada cambio
+        self._pages_view: Optional[Tuple[PageModel, ...]] = None
         self._metadata: Dict[str, Any] = {}
     
     @property
@@ -106,8 +269,19 @@ class DiagramModel(BaseModel):
             self.notify_observers('name_changed', {'old_name': old_name, 'new_name': value})
     
     @property
-    def pages(self) -> List['PageModel']:
-        """Obtiene la lista de páginas del diagrama."""
+    def pages(self) -> Tuple['PageModel', ...]:
+        """Obtiene las páginas del diagrama como tupla inmutable."""
+        if self._pages_view is None:
+            self._pages_view = tuple(self._pages)
+        return self._pages_view
+    
+    def pages_copy(self) -> List['PageModel']:
+        """
+        Obtiene una copia modificable de la lista de páginas.
+        
+        Returns:
+            Lista nueva con las páginas del diagrama
+        """
         return self._pages.copy()
     
     def add_page(self, page: 'PageModel') -> None:
@@ -117,8 +291,12 @@ class DiagramModel(BaseModel):
         Args:
             page: Página a añadir
         """
-        if page not in self._pages:
+        if page not in self._page_index:
+            self._page_index[page] = len(self._pages)
             self._pages.append(page)
+            self._pages_by_name = None
+            self._pages_view = None
+            page.add_observer(self, ('name_changed',))
             self.notify_observers('page_added', {'page': page})
     
     def remove_page(self, page: 'PageModel') -> None:
@@ -128,10 +306,29 @@ class DiagramModel(BaseModel):
         Args:
             page: Página a eliminar
         """
-        if page in self._pages:
-            self._pages.remove(page)
+        index = self._page_index.pop(page, None)
+        if index is not None:
+            del self._pages[index]
+            # Reindexar las páginas posteriores
+            for i in range(index, len(self._pages)):
+                self._page_index[self._pages[i]] = i
+            self._pages_by_name = None
+            self._pages_view = None
+            page.remove_observer(self)
             self.notify_observers('page_removed', {'page': page})
     
+    def page_index(self, page: 'PageModel') -> Optional[int]:
+        """
+        Obtiene el índice de una página.
+        
+        Args:
+            page: Página a buscar
+            
+        Returns:
+            El índice de la página o None si no pertenece al diagrama
+        """
+        return self._page_index.get(page)
+    
     def get_page_by_index(self, index: int) -> Optional['PageModel']:
         """
         Obtiene una página por su índice.
@@ -156,10 +353,25 @@ class DiagramModel(BaseModel):
         Returns:
             La primera página con el nombre especificado o None si no se encuentra
         """
-        for page in self._pages:
-            if page.name == name:
-                return page
-        return None
+        if self._pages_by_name is None:
+            pages_by_name: Dict[str, PageModel] = {}
+            for page in self._pages:
+                pages_by_name.setdefault(page.name, page)
+            self._pages_by_name = pages_by_name
+        return self._pages_by_name.get(name)
+    
+    def model_changed(self, model: BaseModel, change_type: str, data: Any) -> None:
+        """
+        Recibe los cambios de las páginas del diagrama.
+        
+        Args:
+            model: La página que ha cambiado
+            change_type: Tipo de cambio
+            data: Datos adicionales sobre el cambio
+        """
+        # El índice por nombre queda obsoleto al renombrar una página
+        if change_type == 'name_changed':
+            self._pages_by_name = None
     
     def set_metadata(self, key: str, value: Any) -> None:
         """
@@ -169,7 +381,11 @@ class DiagramModel(BaseModel):
             key: Clave de metadatos
             value: Valor de metadatos
         """
-        old_value = self._metadata.get(key)
+        old_value = self._metadata.get(key, _MISSING)
+        if old_value == value:
+            return
+        if old_value is _MISSING:
+            old_value = None
         self._metadata[key] = value
         self.notify_observers('metadata_changed', 
                              {'key': key, 'old_value': old_value, 'new_value': value})
@@ -194,6 +410,9 @@ class PageModel(BaseModel):
     Una página contiene elementos como formas y conectores.
     """
     
+    __slots__ = ('_name', '_elements', '_elements_by_id', '_elements_view', '_removals',
+                 '_properties', '_grid_enabled', '_grid_size', '_next_id_counter')
+    
     def __init__(self, name: str = "Page 1"):
         """
         Inicializa una nueva página.
@@ -204,9 +423,17 @@ class PageModel(BaseModel):
         super().__init__()
         self._name = name
         self._elements: List['ElementModel'] = []
+        # Índice por ID, usado también para comprobar la pertenencia; los IDs
+        # son únicos en la página y no cambian una vez creados
+        self._elements_by_id: Dict[str, 'ElementModel'] = {}
+        # Vista inmutable de los elementos, reconstruida tras cada cambio
+        self._elements_view: Optional[Tuple['ElementModel', ...]] = None
+        # Número de elementos eliminados, para invalidar referencias cacheadas
+        self._removals = 0
         self._properties: Dict[str, Any] = {}
         self._grid_enabled = True
         self._grid_size = 10
+        self._next_id_counter = 0
     
     @property
     def name(self) -> str:
@@ -227,20 +454,57 @@ class PageModel(BaseModel):
             self.notify_observers('name_changed', {'old_name': old_name, 'new_name': value})
     
     @property
-    def elements(self) -> List['ElementModel']:
-        """Obtiene la lista de elementos de la página."""
+    def elements(self) -> Tuple['ElementModel', ...]:
+        """Obtiene los elementos de la página como tupla inmutable."""
+        if self._elements_view is None:
+            self._elements_view = tuple(self._elements)
+        return self._elements_view
+    
+    def elements_copy(self) -> List['ElementModel']:
+        """
+        Obtiene una copia modificable de la lista de elementos.
+        
+        Returns:
+            Lista nueva con los elementos de la página
+        """
         return self._elements.copy()
     
-    def add_element(self, element: 'ElementModel') -> None:
+    def add_element(self, element: 'ElementModel') -> Optional[int]:
         """
         Añade un elemento a la página.
         
         Args:
             element: Elemento a añadir
-        """
-        if element not in self._elements:
-            self._elements.append(element)
+            
+        Returns:
+            El índice del elemento en la página, o None si ya había un
+            elemento con el mismo ID y no se ha añadido
+        """
+        if element.id in self._elements_by_id:
+            return None
+        self._elements.append(element)
+        self._elements_by_id[element.id] = element
+        self._elements_view = None
+        element._set_page(self)
+        if self._observers:
             self.notify_observers('element_added', {'element': element})
+        return len(self._elements) - 1
+    
+    def insert_at(self, index: int, element: 'ElementModel') -> None:
+        """
+        Inserta un elemento en una posición concreta de la página.
+        
+        Args:
+            index: Índice en el que insertar el elemento
+            element: Elemento a insertar
+        """
+        if element.id not in self._elements_by_id:
+            self._elements.insert(index, element)
+            self._elements_by_id[element.id] = element
+            self._elements_view = None
+            element._set_page(self)
+            if self._observers:
+                self.notify_observers('element_added', {'element': element})
     
     def remove_element(self, element: 'ElementModel') -> None:
         """
@@ -249,9 +513,64 @@ class PageModel(BaseModel):
         Args:
             element: Elemento a eliminar
         """
-        if element in self._elements:
+        if self._elements_by_id.get(element.id) is element:
             self._elements.remove(element)
-            self.notify_observers('element_removed', {'element': element})
+            del self._elements_by_id[element.id]
+            self._elements_view = None
+            self._removals += 1
+            element._set_page(None)
+            if self._observers:
+                self.notify_observers('element_removed', {'element': element})
+    
+    def remove_at(self, index: int) -> Optional['ElementModel']:
+        """
+        Elimina el elemento situado en una posición concreta de la página.
+        
+        Args:
+            index: Índice del elemento a eliminar
+            
+        Returns:
+            El elemento eliminado o None si el índice está fuera de rango
+        """
+        if 0 <= index < len(self._elements):
+            element = self._elements.pop(index)
+            self._unindex(element)
+            self._elements_view = None
+            self._removals += 1
+            element._set_page(None)
+            if self._observers:
+                self.notify_observers('element_removed', {'element': element})
+            return element
+        return None
+    
+    def element_at(self, index: int) -> Optional['ElementModel']:
+        """
+        Obtiene el elemento situado en una posición concreta de la página.
+        
+        Args:
+            index: Índice del elemento
+            
+        Returns:
+            El elemento o None si el índice está fuera de rango
+        """
+        if 0 <= index < len(self._elements):
+            return self._elements[index]
+        return None
+    
+    def index_of(self, element: 'ElementModel') -> Optional[int]:
+        """
+        Obtiene la posición de un elemento en la página.
+        
+        Args:
+            element: Elemento a buscar
+            
+        Returns:
+            El índice del elemento o None si no pertenece a la página
+        """
+        try:
+            return self._elements.index(element)
+        except ValueError:
+            return None
     
     def get_element_by_id(self, element_id: str) -> Optional['ElementModel']:
         """
@@ -263,10 +582,33 @@ class PageModel(BaseModel):
         Returns:
             El elemento con el ID especificado o None si no se encuentra
         """
-        for element in self._elements:
-            if element.id == element_id:
-                return element
-        return None
+        return self._elements_by_id.get(element_id)
+    
+    def _unindex(self, element: 'ElementModel') -> None:
+        """
+        Quita un elemento eliminado del índice por ID.
+        
+        Args:
+            element: Elemento eliminado
+        """
+        if self._elements_by_id.get(element.id) is element:
+            del self._elements_by_id[element.id]
+    
+    def next_id(self, prefix: str) -> str:
+        """
+        Genera un ID de elemento que no está en uso en la página.
+        
+        Args:
+            prefix: Prefijo del ID (ej. 'shape', 'connector')
+            
+        Returns:
+            Un ID nuevo con el formato prefijo_n
+        """
+        while True:
+            self._next_id_counter += 1
+            element_id = sys.intern(f"{prefix}_{self._next_id_counter}")
+            if self.get_element_by_id(element_id) is None:
+                return element_id
     
     @property
     def grid_enabled(self) -> bool:
@@ -312,7 +654,11 @@ class PageModel(BaseModel):
             key: Clave de la propiedad
             value: Valor de la propiedad
         """
-        old_value = self._properties.get(key)
+        old_value = self._properties.get(key, _MISSING)
+        if old_value == value:
+            return
+        if old_value is _MISSING:
+            old_value = None
         self._properties[key] = value
         self.notify_observers('property_changed', 
                              {'key': key, 'old_value': old_value, 'new_value': value})
@@ -336,6 +682,8 @@ class ElementModel(BaseModel, ABC):
     Clase base abstracta para todos los elementos de un diagrama.
     """
     
+    __slots__ = ('_id', '_value', '_style', '_style_string_cache', '_position', '_parent_id')
+    
     def __init__(self, element_id: str, value: str = ""):
         """
         Inicializa un nuevo elemento.
@@ -347,7 +695,10 @@ class ElementModel(BaseModel, ABC):
         super().__init__()
         self._id = element_id
         self._value = value
-        self._style: Dict[str, Any] = {}
+        # Puede ser un mapeo compartido de solo lectura (ver adopt_style)
+        self._style: Mapping[str, Any] = {}
+        # String de estilo serializado; None si hay que regenerarlo
+        self._style_string_cache: Optional[str] = None
         self._position: Tuple[float, float] = (0, 0)
         self._parent_id: Optional[str] = None
     
@@ -372,8 +723,9 @@ class ElementModel(BaseModel, ABC):
         if new_value != self._value:
             old_value = self._value
             self._value = new_value
-            self.notify_observers('value_changed', 
-                                 {'old_value': old_value, 'new_value': new_value})
+            if self._observers:
+                self.notify_observers('value_changed', 
+                                     {'old_value': old_value, 'new_value': new_value})
     
     @property
     def position(self) -> Tuple[float, float]:
@@ -388,11 +740,14 @@ class ElementModel(BaseModel, ABC):
         Args:
             new_position: Nueva posición (x, y)
         """
-        if new_position != self._position:
-            old_position = self._position
+        # Comparar las coordenadas directamente, sin la comparación de tuplas
+        new_x, new_y = new_position
+        old_position = self._position
+        if new_x != old_position[0] or new_y != old_position[1]:
             self._position = new_position
-            self.notify_observers('position_changed', 
-                                 {'old_position': old_position, 'new_position': new_position})
+            if self._observers:
+                self.notify_observers('position_changed', 
+                                     {'old_position': old_position, 'new_position': new_position})
     
     @property
     def parent_id(self) -> Optional[str]:
@@ -413,6 +768,11 @@ class ElementModel(BaseModel, ABC):
             self.notify_observers('parent_changed', 
                                  {'old_parent_id': old_parent_id, 'new_parent_id': parent_id})
     
+    @property
+    def style(self) -> Dict[str, Any]:
+        """Obtiene el diccionario de estilo del elemento."""
+        return self._style.copy()
+    
     def set_style(self, key: str, value: Any) -> None:
         """
         Establece un valor de estilo.
@@ -421,10 +781,39 @@ class ElementModel(BaseModel, ABC):
             key: Clave de estilo
             value: Valor de estilo
         """
-        old_value = self._style.get(key)
+        old_value = self._style.get(key, _MISSING)
+        if old_value == value:
+            return
+        if old_value is _MISSING:
+            old_value = None
+        key = _intern(key)
+        value = _intern_style_value(value)
+        
+        # Copia al escribir si el estilo es compartido
+        if type(self._style) is not dict:
+            self._style = dict(self._style)
         self._style[key] = value
-        self.notify_observers('style_changed', 
-                             {'key': key, 'old_value': old_value, 'new_value': value})
+        self._style_string_cache = None
+        if self._observers:
+            self.notify_observers('style_changed', 
+                                 {'key': key, 'old_value': old_value, 'new_value': value})
+    
+    def adopt_style(self, style: MappingProxyType) -> None:
+        """
+        Reemplaza el estilo completo por un mapeo compartido de solo lectura.
+        
+        Varios elementos pueden compartir el mismo mapeo; se copia en la
+        primera llamada a set_style.
+        
+        Args:
+            style: Mapeo de estilo compartido
+        """
+        old_style = self._style
+        self._style = style
+        self._style_string_cache = None
+        if self._observers:
+            self.notify_observers('style_replaced', 
+                                 {'old_style': old_style, 'new_style': style})
     
     def get_style(self, key: str, default: Any = None) -> Any:
         """
@@ -443,18 +832,40 @@ class ElementModel(BaseModel, ABC):
         """
         Aplica un string de estilo en formato drawio (clave=valor;clave=valor;...).
         
+        Todos los valores se aplican de una vez. Con los observadores
+        bloqueados se emite un 'style_changed' por cada clave que cambia y,
+        al final, un 'styles_changed' con todos los valores.
+        
         Args:
             style_string: String de estilo
         """
         if not style_string:
             return
             
-        # Parsear el string de estilo
-        style_pairs = style_string.split(';')
-        for pair in style_pairs:
-            if '=' in pair:
-                key, value = pair.split('=', 1)
-                self.set_style(key.strip(), value.strip())
+        # Parsear el string de estilo en una sola pasada
+        new_values = {_intern(key.strip()): _intern_style_value(value.strip())
+                      for key, value in _STYLE_PAIR_RE.findall(style_string)}
+        if not new_values:
+            return
+        
+        # Copia al escribir si el estilo es compartido
+        if type(self._style) is not dict:
+            self._style = dict(self._style)
+        old_values = {key: self._style.get(key) for key in new_values}
+        self._style.update(new_values)
+        self._style_string_cache = None
+        if self._observers:
+            self.lock_observers()
+            try:
+                for key, value in new_values.items():
+                    old_value = old_values[key]
+                    if old_value != value:
+                        self.notify_observers('style_changed',
+                                             {'key': key, 'old_value': old_value, 'new_value': value})
+                self.notify_observers('styles_changed', 
+                                     {'old_values': old_values, 'new_values': new_values})
+            finally:
+                self.unlock_observers()
     
     def get_style_string(self) -> str:
         """
@@ -463,7 +874,35 @@ class ElementModel(BaseModel, ABC):
         Returns:
             String de estilo (clave=valor;clave=valor;...)
         """
-        return ';'.join(f"{key}={value}" for key, value in self._style.items())
+        if self._style_string_cache is None:
+            self._style_string_cache = ';'.join(f"{key}={value}" for key, value in self._style.items())
+        return self._style_string_cache
+    
+    def _set_page(self, page: Optional[PageModel]) -> None:
+        """
+        Recibe la página a la que se añade el elemento, o None al eliminarlo.
+        
+        Por defecto no hace nada; los elementos que necesitan su página
+        lo redefinen.
+        
+        Args:
+            page: La página o None
+        """
+        pass
+    
+    def _copy_state_to(self, clone: 'ElementModel') -> None:
+        """
+        Copia el estado común de este elemento en un clon recién creado,
+        sin pasar por los setters ni notificar.
+        
+        Args:
+            clone: Elemento recién creado que recibe el estado
+        """
+        # Un estilo compartido de solo lectura se puede seguir compartiendo
+        clone._style = dict(self._style) if type(self._style) is dict else self._style
+        clone._style_string_cache = self._style_string_cache
+        clone._position = self._position
+        clone._parent_id = self._parent_id
     
     @abstractmethod
     def clone(self) -> 'ElementModel':
@@ -5,7 +5,9 @@ This module defines the classes for connector elements in a diagram.
 Connectors are used to connect shapes and other elements.
 """
 
-from typing import Tuple, Dict, Any, Optional, List
+from array import array
+from types import MappingProxyType
+from typing import Tuple, Dict, Any, Optional, List, ClassVar
 from .base import ElementModel
 
 
@@ -15,6 +17,19 @@ class ConnectorModel(ElementModel):
     Connectors are lines that connect shapes and other elements.
     """
     
+    __slots__ = ('_source_id', '_target_id', '_waypoint_xs', '_waypoint_ys', '_waypoints_view')
+    
+    # Read-only default style, shared until first modified
+    _DEFAULT_STYLE: ClassVar[MappingProxyType] = MappingProxyType({
+        "edgeStyle": "orthogonalEdgeStyle",
+        "rounded": "0",
+        "orthogonalLoop": "1",
+        "jettySize": "auto",
+        "html": "1",
+        "strokeColor": "#000000",
+        "strokeWidth": "1",
+    })
+    
     def __init__(self, element_id: str, value: str = "", 
                  source_id: Optional[str] = None, target_id: Optional[str] = None):
         """
@@ -29,16 +44,14 @@ class ConnectorModel(ElementModel):
         super().__init__(element_id, value)
         self._source_id = source_id
         self._target_id = target_id
-        self._waypoints: List[Tuple[float, float]] = []
+        # Waypoint coordinates, stored as parallel arrays of doubles
+        self._waypoint_xs = array('d')
+        self._waypoint_ys = array('d')
+        # Immutable view of the waypoints, rebuilt after each change
+        self._waypoints_view: Optional[Tuple[Tuple[float, float], ...]] = None
         
-        # Set default style for connectors
-        self.set_style("edgeStyle", "orthogonalEdgeStyle")
-        self.set_style("rounded", "0")
-        self.set_style("orthogonalLoop", "1")
-        self.set_style("jettySize", "auto")
-        self.set_style("html", "1")
-        self.set_style("strokeColor", "#000000")
-        self.set_style("strokeWidth", "1")
+        # Share the default style for connectors
+        self._style = self._DEFAULT_STYLE
     
     @property
     def source_id(self) -> Optional[str]:
@@ -79,9 +92,37 @@ class ConnectorModel(ElementModel):
                                 {'old_target_id': old_target_id, 'new_target_id': value})
     
     @property
-    def waypoints(self) -> List[Tuple[float, float]]:
-        """Get the list of waypoints for the connector."""
-        return self._waypoints.copy()
+    def waypoints(self) -> Tuple[Tuple[float, float], ...]:
+        """Get the waypoints of the connector as a tuple of (x, y) float tuples."""
+        if self._waypoints_view is None:
+            self._waypoints_view = tuple(zip(self._waypoint_xs, self._waypoint_ys))
+        return self._waypoints_view
+    
+    @property
+    def waypoint_count(self) -> int:
+        """Get the number of waypoints of the connector."""
+        return len(self._waypoint_xs)
+    
+    def waypoint_arrays(self) -> Tuple[array, array]:
+        """
+        Get copies of the waypoint coordinate arrays.
+        
+        Returns:
+            Tuple (xs, ys) of arrays of doubles
+        """
+        return array('d', self._waypoint_xs), array('d', self._waypoint_ys)
+    
+    def waypoint_bounds(self) -> Optional[Tuple[float, float, float, float]]:
+        """
+        Get the bounding box of the connector's waypoints.
+        
+        Returns:
+            Tuple (min_x, min_y, max_x, max_y), or None if there are no waypoints
+        """
+        if not self._waypoint_xs:
+            return None
+        return (min(self._waypoint_xs), min(self._waypoint_ys),
+                max(self._waypoint_xs), max(self._waypoint_ys))
     
     def add_waypoint(self, x: float, y: float, index: Optional[int] = None) -> None:
         """
@@ -94,10 +135,14 @@ class ConnectorModel(ElementModel):
         """
         waypoint = (x, y)
         if index is None:
-            self._waypoints.append(waypoint)
+            self._waypoint_xs.append(x)
+            self._waypoint_ys.append(y)
         else:
-            self._waypoints.insert(index, waypoint)
-        self.notify_observers('waypoint_added', {'waypoint': waypoint, 'index': index})
+            self._waypoint_xs.insert(index, x)
+            self._waypoint_ys.insert(index, y)
+        self._waypoints_view = None
+        if self._observers:
+            self.notify_observers('waypoint_added', {'waypoint': waypoint, 'index': index})
     
     def remove_waypoint(self, index: int) -> None:
         """
@@ -106,14 +151,33 @@ class ConnectorModel(ElementModel):
         Args:
             index: Index of the waypoint to remove
         """
-        if 0 <= index < len(self._waypoints):
-            waypoint = self._waypoints.pop(index)
-            self.notify_observers('waypoint_removed', {'waypoint': waypoint, 'index': index})
+        if 0 <= index < len(self._waypoint_xs):
+            waypoint = (self._waypoint_xs.pop(index), self._waypoint_ys.pop(index))
+            self._waypoints_view = None
+            if self._observers:
+                self.notify_observers('waypoint_removed', {'waypoint': waypoint, 'index': index})
+    
+    def set_waypoint(self, index: int, x: float, y: float) -> None:
+        """
+        Move a waypoint of the connector.
+        
+        Args:
+            index: Index of the waypoint, negative values count from the end
+            x: New X coordinate of the waypoint
+            y: New Y coordinate of the waypoint
+        """
+        self._waypoint_xs[index] = x
+        self._waypoint_ys[index] = y
+        self._waypoints_view = None
+        if self._observers:
+            self.notify_observers('waypoint_moved', {'waypoint': (x, y), 'index': index})
     
     def clear_waypoints(self) -> None:
         """Remove all waypoints from the connector."""
-        if self._waypoints:
-            self._waypoints.clear()
+        if self._waypoint_xs:
+            del self._waypoint_xs[:]
+            del self._waypoint_ys[:]
+            self._waypoints_view = None
             self.notify_observers('waypoints_cleared', {})
     
     def set_edge_style(self, style: str) -> None:
@@ -162,15 +226,11 @@ class ConnectorModel(ElementModel):
         clone = ConnectorModel(self.id + "_clone", self.value, 
                               self.source_id + "_clone" if self.source_id else None,
                               self.target_id + "_clone" if self.target_id else None)
-        clone.position = self.position
-        clone.parent_id = self.parent_id
-        
-        # Copy all styles
-        for key, value in self._style.items():
-            clone.set_style(key, value)
         
-        # Copy waypoints
-        for waypoint in self._waypoints:
-            clone.add_waypoint(waypoint[0], waypoint[1])
+        # Copy the state directly, bypassing setters and notifications
+        self._copy_state_to(clone)
+        clone._waypoint_xs = array('d', self._waypoint_xs)
+        clone._waypoint_ys = array('d', self._waypoint_ys)
+        clone._waypoints_view = self._waypoints_view
         
         return clone
@@ -4,8 +4,11 @@ PyDiagram - Shape model module
 This module defines the classes for shape elements in a diagram.
 """
 
-from typing import Tuple, Dict, Any, Optional, List
-from .base import ElementModel
+import math
+import weakref
+from types import MappingProxyType
+from typing import Tuple, Dict, Any, Optional, List, ClassVar, Iterator
+from .base import ElementModel, PageModel, _MISSING
 
 
 class ShapeModel(ElementModel):
@@ -14,6 +17,11 @@ class ShapeModel(ElementModel):
     Shapes are visual elements like rectangles, circles, etc.
     """
     
+    __slots__ = ('_shape_type', '_width', '_height', '_rotation', '_bounds_cache')
+    
+    # Read-only default style per shape type, shared until first modified
+    _DEFAULT_STYLES: ClassVar[Dict[str, MappingProxyType]] = {}
+    
     def __init__(self, element_id: str, value: str = "", shape_type: str = "rectangle"):
         """
         Initialize a new shape.
@@ -28,14 +36,35 @@ class ShapeModel(ElementModel):
         self._width = 100.0
         self._height = 60.0
         self._rotation = 0.0
+        # Axis-aligned bounding box; None when it has to be recomputed
+        self._bounds_cache: Optional[Tuple[float, float, float, float]] = None
+        
+        # Share the default style based on shape type
+        self._style = self._default_style(shape_type)
+    
+    @classmethod
+    def _default_style(cls, shape_type: str) -> MappingProxyType:
+        """
+        Get the shared default style for a shape type.
         
-        # Set default style based on shape type
-        self.set_style("shape", shape_type)
-        self.set_style("whiteSpace", "wrap")
-        self.set_style("html", "1")
-        self.set_style("fillColor", "#ffffff")
-        self.set_style("strokeColor", "#000000")
-        self.set_style("strokeWidth", "1")
+        Args:
+            shape_type: Type of shape
+            
+        Returns:
+            The read-only default style
+        """
+        style = cls._DEFAULT_STYLES.get(shape_type)
+        if style is None:
+            style = MappingProxyType({
+                "shape": shape_type,
+                "whiteSpace": "wrap",
+                "html": "1",
+                "fillColor": "#ffffff",
+                "strokeColor": "#000000",
+                "strokeWidth": "1",
+            })
+            cls._DEFAULT_STYLES[shape_type] = style
+        return style
     
     @property
     def shape_type(self) -> str:
@@ -73,8 +102,10 @@ class ShapeModel(ElementModel):
         if value != self._width and value > 0:
             old_width = self._width
             self._width = value
-            self.notify_observers('size_changed', 
-                                {'width': {'old': old_width, 'new': value}, 'height': self._height})
+            self._bounds_cache = None
+            if self._observers:
+                self.notify_observers('size_changed', 
+                                    {'width': {'old': old_width, 'new': value}, 'height': self._height})
     
     @property
     def height(self) -> float:
@@ -92,8 +123,10 @@ class ShapeModel(ElementModel):
         if value != self._height and value > 0:
             old_height = self._height
             self._height = value
-            self.notify_observers('size_changed', 
-                                {'height': {'old': old_height, 'new': value}, 'width': self._width})
+            self._bounds_cache = None
+            if self._observers:
+                self.notify_observers('size_changed', 
+                                    {'height': {'old': old_height, 'new': value}, 'width': self._width})
     
     def set_size(self, width: float, height: float) -> None:
         """
@@ -103,14 +136,53 @@ class ShapeModel(ElementModel):
             width: New width
             height: New height
         """
-        if (width != self._width or height != self._height) and width > 0 and height > 0:
-            old_width = self._width
-            old_height = self._height
+        old_width = self._width
+        old_height = self._height
+        if (width != old_width or height != old_height) and width > 0 and height > 0:
             self._width = width
             self._height = height
-            self.notify_observers('size_changed', 
-                                {'width': {'old': old_width, 'new': width}, 
-                                 'height': {'old': old_height, 'new': height}})
+            self._bounds_cache = None
+            if self._observers:
+                self.notify_observers('size_changed', 
+                                    {'width': {'old': old_width, 'new': width}, 
+                                     'height': {'old': old_height, 'new': height}})
+    
+    @ElementModel.position.setter
+    def position(self, new_position: Tuple[float, float]) -> None:
+        """
+        Set the position of the shape.
+        
+        Args:
+            new_position: New position (x, y)
+        """
+        old_position = self._position
+        ElementModel.position.fset(self, new_position)
+        if self._position is not old_position:
+            self._bounds_cache = None
+    
+    @property
+    def bounds(self) -> Tuple[float, float, float, float]:
+        """
+        Get the axis-aligned bounding box of the shape, including its rotation
+        around the center.
+        
+        Returns:
+            Tuple (min_x, min_y, max_x, max_y)
+        """
+        if self._bounds_cache is None:
+            x, y = self._position
+            width, height = self._width, self._height
+            if self._rotation:
+                angle = math.radians(self._rotation)
+                cos_a, sin_a = abs(math.cos(angle)), abs(math.sin(angle))
+                half_width = (width * cos_a + height * sin_a) / 2
+                half_height = (width * sin_a + height * cos_a) / 2
+                center_x, center_y = x + width / 2, y + height / 2
+                self._bounds_cache = (center_x - half_width, center_y - half_height,
+                                      center_x + half_width, center_y + half_height)
+            else:
+                self._bounds_cache = (x, y, x + width, y + height)
+        return self._bounds_cache
     
     @property
     def rotation(self) -> float:
@@ -130,9 +202,11 @@ class ShapeModel(ElementModel):
         if value != self._rotation:
             old_rotation = self._rotation
             self._rotation = value
+            self._bounds_cache = None
             self.set_style("rotation", str(value))
-            self.notify_observers('rotation_changed', 
-                                {'old_rotation': old_rotation, 'new_rotation': value})
+            if self._observers:
+                self.notify_observers('rotation_changed', 
+                                    {'old_rotation': old_rotation, 'new_rotation': value})
     
     def clone(self) -> 'ShapeModel':
         """
@@ -142,14 +216,12 @@ class ShapeModel(ElementModel):
             A new instance with the same properties
         """
         clone = ShapeModel(self.id + "_clone", self.value, self.shape_type)
-        clone.position = self.position
-        clone.set_size(self.width, self.height)
-        clone.rotation = self.rotation
-        clone.parent_id = self.parent_id
         
-        # Copy all styles
-        for key, value in self._style.items():
-            clone.set_style(key, value)
+        # Copy the state directly, bypassing setters and notifications
+        self._copy_state_to(clone)
+        clone._width = self._width
+        clone._height = self._height
+        clone._rotation = self._rotation
         
         return clone
 
@@ -160,6 +232,17 @@ class GroupModel(ElementModel):
     Groups can contain shapes, connectors, and other groups.
     """
     
+    __slots__ = ('_children_ids', '_children_view', '_collapsed',
+                 '_page_ref', '_children_refs', '_children_refs_removals')
+    
+    # Read-only default style, shared until first modified
+    _DEFAULT_STYLE: ClassVar[MappingProxyType] = MappingProxyType({
+        "group": "1",
+        "fillColor": "none",
+        "strokeColor": "#666666",
+        "dashed": "1",
+    })
+    
     def __init__(self, element_id: str, value: str = ""):
         """
         Initialize a new group.
@@ -169,19 +252,25 @@ class GroupModel(ElementModel):
             value: Text or value of the element
         """
         super().__init__(element_id, value)
-        self._children_ids: List[str] = []
+        # Dictionary used as an ordered set
+        self._children_ids: Dict[str, None] = {}
+        # Immutable view of the child IDs, rebuilt after each change
+        self._children_view: Optional[Tuple[str, ...]] = None
         self._collapsed = False
+        # Page holding the group and weak references to the resolved children
+        self._page_ref: Optional[weakref.ref] = None
+        self._children_refs: Dict[str, weakref.ref] = {}
+        self._children_refs_removals = 0
         
-        # Set default style for groups
-        self.set_style("group", "1")
-        self.set_style("fillColor", "none")
-        self.set_style("strokeColor", "#666666")
-        self.set_style("dashed", "1")
+        # Share the default style for groups
+        self._style = self._DEFAULT_STYLE
     
     @property
-    def children_ids(self) -> List[str]:
-        """Get the list of child element IDs."""
-        return self._children_ids.copy()
+    def children_ids(self) -> Tuple[str, ...]:
+        """Get the child element IDs as an immutable tuple."""
+        if self._children_view is None:
+            self._children_view = tuple(self._children_ids)
+        return self._children_view
     
     def add_child(self, child_id: str) -> None:
         """
@@ -191,7 +280,8 @@ class GroupModel(ElementModel):
             child_id: ID of the child element
         """
         if child_id not in self._children_ids:
-            self._children_ids.append(child_id)
+            self._children_ids[child_id] = None
+            self._children_view = None
             self.notify_observers('child_added', {'child_id': child_id})
     
     def remove_child(self, child_id: str) -> None:
@@ -201,10 +291,50 @@ class GroupModel(ElementModel):
         Args:
             child_id: ID of the child element
         """
-        if child_id in self._children_ids:
-            self._children_ids.remove(child_id)
+        if self._children_ids.pop(child_id, _MISSING) is not _MISSING:
+            self._children_refs.pop(child_id, None)
+            self._children_view = None
             self.notify_observers('child_removed', {'child_id': child_id})
     
+    def children(self) -> Iterator[ElementModel]:
+        """
+        Iterate over the child elements present on the group's page.
+        
+        Children are resolved by ID on first use and then reached through
+        weak references, which are dropped when the page removes elements.
+        
+        Returns:
+            Iterator over the child elements
+        """
+        page = self._page_ref() if self._page_ref is not None else None
+        if page is None:
+            return
+        
+        refs = self._children_refs
+        if self._children_refs_removals != page._removals:
+            refs.clear()
+            self._children_refs_removals = page._removals
+        
+        for child_id in self.children_ids:
+            ref = refs.get(child_id)
+            child = ref() if ref is not None else None
+            if child is None:
+                child = page.get_element_by_id(child_id)
+                if child is None:
+                    continue
+                refs[child_id] = weakref.ref(child)
+            yield child
+    
+    def _set_page(self, page: Optional[PageModel]) -> None:
+        """
+        Remember the page holding the group.
+        
+        Args:
+            page: The page, or None when the group is removed from it
+        """
+        self._page_ref = weakref.ref(page) if page is not None else None
+        self._children_refs = {}
+    
     @property
     def collapsed(self) -> bool:
         """Get whether the group is collapsed."""
@@ -230,16 +360,10 @@ class GroupModel(ElementModel):
             A new instance with the same properties
         """
         clone = GroupModel(self.id + "_clone", self.value)
-        clone.position = self.position
-        clone.parent_id = self.parent_id
-        clone.collapsed = self.collapsed
-        
-        # Copy all styles
-        for key, value in self._style.items():
-            clone.set_style(key, value)
         
-        # Copy children IDs
-        for child_id in self._children_ids:
-            clone.add_child(child_id + "_clone")
+        # Copy the state directly, bypassing setters and notifications
+        self._copy_state_to(clone)
+        clone._collapsed = self._collapsed
+        clone._children_ids = {child_id + "_clone": None for child_id in self._children_ids}
         
         return clone
@@ -2,14 +2,45 @@
 PyDiagram - Services initialization module
 
 This module initializes the services package and imports key classes.
+The export services are imported on first access.
 """
 
+import importlib
+
 from .file_service import FileService
-from .export_service import ExportService
-from .additional_export_formats import AdditionalExportFormats
+
+# Classes imported on first access, by the module that defines them
+_LAZY_IMPORTS = {
+    'ExportService': '.export_service',
+    'AdditionalExportFormats': '.additional_export_formats',
+}
 
 __all__ = [
     'FileService',
     'ExportService',
     'AdditionalExportFormats'
 ]
+
+
+def __getattr__(name: str):
+    """
+    Import a lazily loaded service class.
+    
+    Args:
+        name: Name of the attribute
+        
+    Returns:
+        The service class
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the package attributes, including the lazily loaded ones."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -6,280 +6,104 @@ beyond the basic SVG and ODP formats already implemented in the export_service.
 Includes support for Visio, PNG, PDF, and other common diagram formats.
 """
 
+import io
 import os
+import re
+import html
 import sys
+import functools
+import operator
+import multiprocessing
 import tempfile
 import subprocess
+from xml.sax.saxutils import escape as xml_escape
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Optional, Dict, Any, List, Tuple
 
 from ..model import DiagramModel, PageModel, ElementModel, ShapeModel, ConnectorModel
-from ..services import ExportService
+from .export_service import ExportService
 
+# Optional converters, resolved once at import time
+try:
+    import cairosvg
+except (ImportError, OSError):
+    # OSError: cairosvg is installed but the cairo library is not
+    cairosvg = None
 
-class AdditionalExportFormats:
-    """
-    Class providing methods to export diagrams to various additional formats.
-    Extends the basic export capabilities with support for more specialized formats.
-    """
-    
-    @staticmethod
-    def export_to_visio(diagram: DiagramModel, file_path: str) -> bool:
-        """
-        Export a diagram to Visio XML format (.vsdx).
-        
-        Args:
-            diagram: The diagram model to export
-            file_path: Path to save the Visio file
-            
-        Returns:
-            True if exporting was successful, False otherwise
-        """
-        try:
-            # First export to SVG as an intermediate format
-            with tempfile.TemporaryDirectory() as temp_dir:
-                svg_path = os.path.join(temp_dir, "temp_diagram.svg")
-                
-                # Export each page to SVG
-                page_files = []
-                for i, page in enumerate(diagram.pages):
-                    page_svg_path = os.path.join(temp_dir, f"page_{i}.svg")
-                    ExportService.export_to_svg(diagram, i, page_svg_path)
-                    page_files.append(page_svg_path)
-                
-                # Create a simple Visio XML structure
-                visio_xml = """<?xml version="1.0" encoding="UTF-8" standalone="no"?>
-<VisioDocument xmlns="http://schemas.microsoft.com/visio/2003/core">
-  <Pages>
-"""
-                
-                # Add each page
-                for i, page in enumerate(diagram.pages):
-                    visio_xml += f"""    <Page ID="{i+1}" Name="{page.name}">
-      <Shapes>
-"""
-                    
-                    # Add shapes from SVG (simplified approach)
-                    for element in page.elements:
-                        if isinstance(element, ShapeModel):
-                            x, y = element.position
-                            width = element.width
-                            height = element.height
-                            
-                            visio_xml += f"""        <Shape ID="{element.id}" Type="{element.shape_type}">
+# Drawing several pages into one PDF relies on cairosvg's private surface
+# API, so it is only used with the 2.x releases it was written against
+_CAIROSVG_PAGED = (cairosvg is not None
+                   and getattr(cairosvg, '__version__', '').split('.')[0] == '2')
+
+try:
+    # PyPDF2 3.x appends through PdfWriter; PdfMerger is the older API
+    from PyPDF2 import PdfWriter as PdfMerger
+    PdfMerger.append
+except (ImportError, AttributeError):
+    try:
+        from PyPDF2 import PdfMerger
+    except ImportError:
+        PdfMerger = None
+
+def _xml_attr(value: Any) -> str:
+    """Escape a value for use inside a double-quoted XML attribute."""
+    return xml_escape(str(value), {'"': '&quot;'})
+
+
+# Visio XML of a single shape and connector
+_VISIO_SHAPE = """        <Shape ID="{id}" Type="{type}">
           <XForm>
-            <PinX>{x + width/2}</PinX>
-            <PinY>{y + height/2}</PinY>
+            <PinX>{pin_x}</PinX>
+            <PinY>{pin_y}</PinY>
             <Width>{width}</Width>
             <Height>{height}</Height>
           </XForm>
-          <Text>{element.value}</Text>
+          <Text>{text}</Text>
         </Shape>
 """
-                    
-                    # Add connectors
-                    for element in page.elements:
-                        if isinstance(element, ConnectorModel):
-                            visio_xml += f"""        <Shape ID="{element.id}" Type="Connector">
+
+_VISIO_CONNECTOR = """        <Shape ID="{id}" Type="Connector">
           <Connects>
-            <Connect FromSheet="{element.source_id}" ToSheet="{element.target_id}" />
+            <Connect FromSheet="{source}" ToSheet="{target}" />
           </Connects>
-          <Text>{element.value}</Text>
+          <Text>{text}</Text>
         </Shape>
 """
-                    
-                    visio_xml += """      </Shapes>
-    </Page>
-"""
-                
-                visio_xml += """  </Pages>
-</VisioDocument>
-"""
-                
-                # Write the Visio XML to a temporary file
-                temp_visio_path = os.path.join(temp_dir, "temp_diagram.vdx")
-                with open(temp_visio_path, "w", encoding="utf-8") as f:
-                    f.write(visio_xml)
-                
-                # In a real implementation, we would convert this to VSDX format
-                # For now, we'll just copy the VDX file to the target path
-                with open(temp_visio_path, "rb") as src, open(file_path, "wb") as dst:
-                    dst.write(src.read())
-            
-            return True
-        
-        except Exception as e:
-            print(f"Error exporting to Visio format: {e}")
-            return False
-    
-    @staticmethod
-    def export_to_png(diagram: DiagramModel, page_index: int, file_path: str) -> bool:
-        """
-        Export a diagram page to PNG format.
-        
-        Args:
-            diagram: The diagram model to export
-            page_index: Index of the page to export
-            file_path: Path to save the PNG file
-            
-        Returns:
-            True if exporting was successful, False otherwise
-        """
-        try:
-            # First export to SVG as an intermediate format
-            with tempfile.TemporaryDirectory() as temp_dir:
-                svg_path = os.path.join(temp_dir, "temp_diagram.svg")
-                
-                # Export to SVG
-                svg_content = ExportService.export_to_svg(diagram, page_index, svg_path)
-                if not svg_content and not os.path.exists(svg_path):
-                    return False
-                
-                # Convert SVG to PNG using a command-line tool like Inkscape or cairosvg
-                # For this example, we'll use cairosvg which is a Python library
-                try:
-                    import cairosvg
-                    cairosvg.svg2png(url=svg_path, write_to=file_path)
-                    return True
-                except ImportError:
-                    # If cairosvg is not available, try using Inkscape if installed
-                    try:
-                        subprocess.run(
-                            ["inkscape", "--export-filename", file_path, svg_path],
-                            check=True,
-                            stdout=subprocess.PIPE,
-                            stderr=subprocess.PIPE
-                        )
-                        return True
-                    except (subprocess.SubprocessError, FileNotFoundError):
-                        print("Error: Neither cairosvg nor Inkscape is available for PNG conversion")
-                        return False
-        
-        except Exception as e:
-            print(f"Error exporting to PNG format: {e}")
-            return False
-    
-    @staticmethod
-    def export_to_pdf(diagram: DiagramModel, file_path: str) -> bool:
-        """
-        Export a diagram to PDF format.
-        
-        Args:
-            diagram: The diagram model to export
-            file_path: Path to save the PDF file
-            
-        Returns:
-            True if exporting was successful, False otherwise
-        """
-        try:
-            # First export to SVG as an intermediate format
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Export each page to SVG
-                svg_files = []
-                for i, page in enumerate(diagram.pages):
-                    svg_path = os.path.join(temp_dir, f"page_{i}.svg")
-                    ExportService.export_to_svg(diagram, i, svg_path)
-                    svg_files.append(svg_path)
-                
-                # Convert SVGs to PDF using a command-line tool like Inkscape or cairosvg
-                try:
-                    import cairosvg
-                    
-                    # For multiple pages, we need to create individual PDFs and then merge them
-                    pdf_files = []
-                    for i, svg_file in enumerate(svg_files):
-                        pdf_path = os.path.join(temp_dir, f"page_{i}.pdf")
-                        cairosvg.svg2pdf(url=svg_file, write_to=pdf_path)
-                        pdf_files.append(pdf_path)
-                    
-                    # Merge PDFs if there are multiple pages
-                    if len(pdf_files) > 1:
-                        try:
-                            from PyPDF2 import PdfMerger
-                            
-                            merger = PdfMerger()
-                            for pdf_file in pdf_files:
-                                merger.append(pdf_file)
-                            
-                            merger.write(file_path)
-                            merger.close()
-                            return True
-                        except ImportError:
-                            # If PyPDF2 is not available, just use the first page
-                            with open(pdf_files[0], "rb") as src, open(file_path, "wb") as dst:
-                                dst.write(src.read())
-                            return True
-                    else:
-                        # Just copy the single PDF
-                        with open(pdf_files[0], "rb") as src, open(file_path, "wb") as dst:
-                            dst.write(src.read())
-                        return True
-                
-                except ImportError:
-                    # If cairosvg is not available, try using Inkscape if installed
-                    try:
-                        # For multiple pages, we need to create individual PDFs and then merge them
-                        pdf_files = []
-                        for i, svg_file in enumerate(svg_files):
-                            pdf_path = os.path.join(temp_dir, f"page_{i}.pdf")
-                            subprocess.run(
-                                ["inkscape", "--export-filename", pdf_path, svg_file],
-                                check=True,
-                                stdout=subprocess.PIPE,
-                                stderr=subprocess.PIPE
-                            )
-                            pdf_files.append(pdf_path)
-                        
-                        # Merge PDFs if there are multiple pages
-                        if len(pdf_files) > 1:
-                            try:
-                                from PyPDF2 import PdfMerger
-                                
-                                merger = PdfMerger()
-                                for pdf_file in pdf_files:
-                                    merger.append(pdf_file)
-                                
-                                merger.write(file_path)
-                                merger.close()
-                                return True
-                            except ImportError:
-                                # If PyPDF2 is not available, just use the first page
-                                with open(pdf_files[0], "rb") as src, open(file_path, "wb") as dst:
-                                    dst.write(src.read())
-                                return True
-                        else:
-                            # Just copy the single PDF
-                            with open(pdf_files[0], "rb") as src, open(file_path, "wb") as dst:
-                                dst.write(src.read())
-                            return True
-                    
-                    except (subprocess.SubprocessError, FileNotFoundError):
-                        print("Error: Neither cairosvg nor Inkscape is available for PDF conversion")
-                        return False
-        
-        except Exception as e:
-            print(f"Error exporting to PDF format: {e}")
-            return False
-    
-    @staticmethod
-    def export_to_html(diagram: DiagramModel, file_path: str) -> bool:
-        """
-        Export a diagram to interactive HTML format.
-        
-        Args:
-            diagram: The diagram model to export
-            file_path: Path to save the HTML file
-            
-        Returns:
-            True if exporting was successful, False otherwise
-        """
-        try:
-            # Create a basic HTML structure with embedded SVG
-            html_content = """<!DOCTYPE html>
+
+# Fields read from each shape and connector, in a single C-level call
+_visio_shape_fields = operator.attrgetter('id', 'shape_type', 'position', 'width', 'height', 'value')
+_visio_connector_fields = operator.attrgetter('id', 'source_id', 'target_id', 'value')
+
+
+# Opening tag of an element group in the SVG produced by ExportService
+_SVG_GROUP_RE = re.compile(r'<g id="([^"]+)"')
+
+
+def _element_group_tag(match: "re.Match", values: Dict[str, str]) -> str:
+    """Add the interactive class and data attributes to an element group tag."""
+    element_id = match.group(1)
+    if element_id not in values:
+        return match.group(0)
+    return (f'<g id="{element_id}" class="element" data-id="{element_id}" '
+            f'data-value="{html.escape(values[element_id], quote=True)}"')
+
+
+# Memory-backed location for intermediate files on Linux, default temp dir elsewhere
+_TMP_DIR = ("/dev/shm"
+            if sys.platform.startswith("linux") and os.access("/dev/shm", os.W_OK)
+            else None)
+
+
+# Fixed parts of the interactive HTML export, around the title, page options and pages
+_HTML_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>""" + diagram.name + """</title>
+    <title>"""
+
+_HTML_STYLE = """</title>
     <style>
         body {
             font-family: Arial, sans-serif;
@@ -331,48 +155,16 @@ class AdditionalExportFormats:
     <div class="toolbar">
         <select class="page-selector" id="pageSelector">
 """
-            
-            # Add page options
-            for i, page in enumerate(diagram.pages):
-                selected = ' selected' if i == 0 else ''
-                html_content += f'            <option value="page-{i}"{selected}>{page.name}</option>\n'
-            
-            html_content += """        </select>
+
+_HTML_TOOLBAR_END = """        </select>
         <button id="zoomIn">Zoom In</button>
         <button id="zoomOut">Zoom Out</button>
         <button id="resetZoom">Reset Zoom</button>
     </div>
     <div class="diagram-container" id="diagramContainer">
 """
-            
-            # Add each page as SVG
-            for i, page in enumerate(diagram.pages):
-                active = ' active' if i == 0 else ''
-                html_content += f'        <div class="diagram-page{active}" id="page-{i}">\n'
-                
-                # Export page to SVG and embed it
-                svg_content = ExportService.export_to_svg(diagram, i)
-                if svg_content:
-                    # Remove XML declaration and add class to elements
-                    svg_content = svg_content.replace('<?xml version="1.0" encoding="UTF-8" standalone="no"?>\n', '')
-                    
-                    # Add element IDs to SVG elements for interactivity
-                    for element in page.elements:
-                        if isinstance(element, ShapeModel) or isinstance(element, ConnectorModel):
-                            element_id = element.id
-                            element_value = element.value or ""
-                            
-                            # Add data attributes to the SVG elements
-                            svg_content = svg_content.replace(
-                                f'<g id="{element_id}"',
-                                f'<g id="{element_id}" class="element" data-id="{element_id}" data-value="{element_value}"'
-                            )
-                    
-                    html_content += svg_content + '\n'
-                
-                html_content += '        </div>\n'
-            
-            html_content += """    </div>
+
+_HTML_TAIL = """    </div>
     <div class="tooltip" id="tooltip"></div>
     
     <script>
@@ -439,10 +231,377 @@ class AdditionalExportFormats:
 </body>
 </html>
 """
+
+
+def _svg_to_pdf(svg: bytes) -> bytes:
+    """Convert a single SVG document to PDF with cairosvg."""
+    return cairosvg.svg2pdf(bytestring=svg)
+
+
+def _svg_pages_to_pdf(pages: List[bytes], file_obj) -> None:
+    """
+    Draw SVG documents as consecutive pages of a single PDF with cairosvg.
+    
+    Args:
+        pages: The SVG documents, one per page
+        file_obj: Binary file object receiving the PDF
+    """
+    document = None
+    
+    class PageSurface(cairosvg.surface.PDFSurface):
+        def _create_surface(self, width, height):
+            # Start a new page of the shared document, sized for this SVG
+            nonlocal document
+            if document is None:
+                document = cairosvg.surface.cairo.PDFSurface(self.output, width, height)
+            else:
+                document.show_page()
+                document.set_size(width, height)
+            return document, width, height
+    
+    for svg in pages:
+        PageSurface(cairosvg.parser.Tree(bytestring=svg), file_obj, 96)
+    document.finish()
+
+
+def _inkscape_export(svg: bytes, export_type: str = "pdf", file_path: str = "-") -> Optional[bytes]:
+    """
+    Convert a single SVG document with Inkscape, piping it through stdin.
+    
+    Args:
+        svg: The SVG document
+        export_type: The Inkscape export type (pdf, png, ...)
+        file_path: Path to write the result to, or "-" to return it
+        
+    Returns:
+        The converted document when writing to stdout, otherwise None
+    """
+    result = subprocess.run(
+        ["inkscape", "--pipe", f"--export-type={export_type}",
+         f"--export-filename={file_path}"],
+        input=svg,
+        check=True,
+        stdout=subprocess.PIPE if file_path == "-" else subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    return result.stdout
+
+
+def _inkscape_export_pages(pages: List[bytes], export_type: str = "pdf") -> List[bytes]:
+    """
+    Convert several SVG documents with a single Inkscape process.
+    
+    Starting Inkscape dominates the cost of a conversion, so all pages are
+    handed to one batch invocation instead of spawning a process per page.
+    
+    Args:
+        pages: The SVG documents, one per page
+        export_type: The Inkscape export type (pdf, png, ...)
+        
+    Returns:
+        The converted documents, in page order
+    """
+    if len(pages) <= 1:
+        return [_inkscape_export(svg, export_type) for svg in pages]
+    
+    with tempfile.TemporaryDirectory(dir=_TMP_DIR) as temp_dir:
+        svg_paths = []
+        for i, svg in enumerate(pages):
+            svg_path = os.path.join(temp_dir, f"page_{i}.svg")
+            with open(svg_path, "wb") as f:
+                f.write(svg)
+            svg_paths.append(svg_path)
+        
+        subprocess.run(
+            ["inkscape", f"--export-type={export_type}", *svg_paths],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        
+        converted = []
+        for svg_path in svg_paths:
+            with open(f"{os.path.splitext(svg_path)[0]}.{export_type}", "rb") as f:
+                converted.append(f.read())
+        return converted
+
+
+@functools.lru_cache(maxsize=None)
+def _converter_pool() -> ProcessPoolExecutor:
+    """
+    Worker processes for page conversion, kept alive between exports.
+    
+    Each worker loads cairo and its font configuration on its first page;
+    reusing the pool keeps that state instead of paying it on every export.
+    Where available, workers are started from a forkserver that has already
+    imported this module (and cairosvg), rather than forked from the GUI
+    process and its threads.
+    """
+    mp_context = None
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        mp_context = multiprocessing.get_context("forkserver")
+        mp_context.set_forkserver_preload([__name__])
+    return ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=mp_context)
+
+
+def _convert_pages(convert, pages: List[bytes]) -> List[bytes]:
+    """
+    Run a page converter over the SVG documents of a diagram concurrently.
+    
+    Args:
+        convert: Module-level converter taking the SVG bytes of one page
+        pages: The SVG documents, one per page
+        
+    Returns:
+        The converted documents, in page order
+    """
+    if len(pages) <= 1:
+        return [convert(svg) for svg in pages]
+    
+    try:
+        return list(_converter_pool().map(convert, pages))
+    except BrokenProcessPool:
+        # A worker died; start a fresh pool for the next export
+        _converter_pool.cache_clear()
+        raise
+
+
+def _merge_pdfs(pdf_pages: List[bytes], file_path: str) -> None:
+    """Merge per-page PDFs into file_path, keeping only the first page without PyPDF2."""
+    if len(pdf_pages) > 1 and PdfMerger is not None:
+        merger = PdfMerger()
+        for pdf in pdf_pages:
+            merger.append(io.BytesIO(pdf))
+        
+        with open(file_path, "wb") as f:
+            merger.write(f)
+        return
+    
+    # Single page, or PyPDF2 is not available: just use the first page
+    with open(file_path, "wb") as f:
+        f.write(pdf_pages[0])
+
+
+class AdditionalExportFormats:
+    """
+    Class providing methods to export diagrams to various additional formats.
+    Extends the basic export capabilities with support for more specialized formats.
+    """
+    
+    @staticmethod
+    def export_to_visio(diagram: DiagramModel, file_path: str) -> bool:
+        """
+        Export a diagram to Visio XML format (.vsdx).
+        
+        Args:
+            diagram: The diagram model to export
+            file_path: Path to save the Visio file
+            
+        Returns:
+            True if exporting was successful, False otherwise
+        """
+        try:
+            # Create a simple Visio XML structure
+            parts = ["""<?xml version="1.0" encoding="UTF-8" standalone="no"?>
+<VisioDocument xmlns="http://schemas.microsoft.com/visio/2003/core">
+  <Pages>
+"""]
+            
+            # Add each page
+            for i, page in enumerate(diagram.pages):
+                parts.append(f"""    <Page ID="{i+1}" Name="{_xml_attr(page.name)}">
+      <Shapes>
+""")
+                
+                # Add shapes, then connectors, in a single pass over the elements
+                connector_parts = []
+                for element in page.elements:
+                    if isinstance(element, ShapeModel):
+                        element_id, shape_type, (x, y), width, height, value = _visio_shape_fields(element)
+                        
+                        parts.append(_VISIO_SHAPE.format(
+                            id=_xml_attr(element_id),
+                            type=_xml_attr(shape_type),
+                            pin_x=x + width * 0.5,
+                            pin_y=y + height * 0.5,
+                            width=width,
+                            height=height,
+                            text=xml_escape(value or "")
+                        ))
+                    elif isinstance(element, ConnectorModel):
+                        element_id, source_id, target_id, value = _visio_connector_fields(element)
+                        
+                        connector_parts.append(_VISIO_CONNECTOR.format(
+                            id=_xml_attr(element_id),
+                            source=_xml_attr(source_id),
+                            target=_xml_attr(target_id),
+                            text=xml_escape(value or "")
+                        ))
+                parts.extend(connector_parts)
+                
+                parts.append("""      </Shapes>
+    </Page>
+""")
+            
+            parts.append("""  </Pages>
+</VisioDocument>
+""")
+            
+            # In a real implementation, we would convert this to VSDX format
+            # For now, we'll just write the VDX XML to the target path
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.writelines(parts)
             
-            # Write the HTML file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            return True
+        
+        except Exception as e:
+            print(f"Error exporting to Visio format: {e}")
+            return False
+    
+    @staticmethod
+    def export_to_png(diagram: DiagramModel, page_index: int, file_path: str) -> bool:
+        """
+        Export a diagram page to PNG format.
+        
+        Args:
+            diagram: The diagram model to export
+            page_index: Index of the page to export
+            file_path: Path to save the PNG file
+            
+        Returns:
+            True if exporting was successful, False otherwise
+        """
+        try:
+            # First export to SVG as an intermediate format, kept in memory
+            svg_content = ExportService.export_to_svg(diagram, page_index)
+            if not svg_content:
+                return False
+            svg = svg_content.encode('utf-8')
+            
+            # Convert SVG to PNG using a command-line tool like Inkscape or cairosvg
+            # For this example, we'll use cairosvg which is a Python library
+            if cairosvg is not None:
+                cairosvg.svg2png(bytestring=svg, write_to=file_path)
+                return True
+            
+            # If cairosvg is not available, try using Inkscape if installed
+            try:
+                _inkscape_export(svg, "png", file_path)
+                return True
+            except (subprocess.SubprocessError, FileNotFoundError):
+                print("Error: Neither cairosvg nor Inkscape is available for PNG conversion")
+                return False
+        
+        except Exception as e:
+            print(f"Error exporting to PNG format: {e}")
+            return False
+    
+    @staticmethod
+    def export_to_pdf(diagram: DiagramModel, file_path: str) -> bool:
+        """
+        Export a diagram to PDF format.
+        
+        Args:
+            diagram: The diagram model to export
+            file_path: Path to save the PDF file
+            
+        Returns:
+            True if exporting was successful, False otherwise
+        """
+        try:
+            # First export each page to SVG as an intermediate format, kept in memory
+            svg_pages = []
+            for i in range(len(diagram.pages)):
+                svg_content = ExportService.export_to_svg(diagram, i)
+                if not svg_content:
+                    return False
+                svg_pages.append(svg_content.encode('utf-8'))
+            
+            # Convert SVGs to PDF using cairosvg if available, otherwise Inkscape.
+            # With several cores and PyPDF2, cairosvg converts pages in separate
+            # processes and the results are merged; otherwise it draws every page
+            # straight into one document, or converts page by page and merges
+            # when its private surface API is not the expected one. Inkscape
+            # converts all pages in one run to pay its startup only once.
+            if cairosvg is not None:
+                if len(svg_pages) > 1 and PdfMerger is not None and (os.cpu_count() or 1) > 1:
+                    pdf_pages = _convert_pages(_svg_to_pdf, svg_pages)
+                elif _CAIROSVG_PAGED:
+                    try:
+                        with open(file_path, "wb") as f:
+                            _svg_pages_to_pdf(svg_pages, f)
+                        return True
+                    except (AttributeError, TypeError):
+                        # The private surface API changed; convert page by page
+                        pdf_pages = [_svg_to_pdf(svg) for svg in svg_pages]
+                else:
+                    pdf_pages = [_svg_to_pdf(svg) for svg in svg_pages]
+            else:
+                try:
+                    pdf_pages = _inkscape_export_pages(svg_pages, "pdf")
+                except (subprocess.SubprocessError, FileNotFoundError):
+                    print("Error: Neither cairosvg nor Inkscape is available for PDF conversion")
+                    return False
+            
+            _merge_pdfs(pdf_pages, file_path)
+            return True
+        
+        except Exception as e:
+            print(f"Error exporting to PDF format: {e}")
+            return False
+    
+    @staticmethod
+    def export_to_html(diagram: DiagramModel, file_path: str) -> bool:
+        """
+        Export a diagram to interactive HTML format.
+        
+        Args:
+            diagram: The diagram model to export
+            file_path: Path to save the HTML file
+            
+        Returns:
+            True if exporting was successful, False otherwise
+        """
+        try:
+            # Stream the document to the file, one page SVG at a time
+            with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.write(_HTML_HEAD)
+                f.write(html.escape(diagram.name))
+                f.write(_HTML_STYLE)
+                
+                # Add page options
+                escape = html.escape
+                for i, page in enumerate(diagram.pages):
+                    selected = ' selected' if i == 0 else ''
+                    f.write(f'            <option value="page-{i}"{selected}>{escape(page.name)}</option>\n')
+                
+                f.write(_HTML_TOOLBAR_END)
+                
+                # Add each page as SVG
+                for i, page in enumerate(diagram.pages):
+                    active = ' active' if i == 0 else ''
+                    f.write(f'        <div class="diagram-page{active}" id="page-{i}">\n')
+                    
+                    # Export page to SVG and embed it
+                    svg_content = ExportService.export_to_svg(diagram, i)
+                    if svg_content:
+                        # Remove XML declaration and add class to elements
+                        svg_content = svg_content.replace('<?xml version="1.0" encoding="UTF-8" standalone="no"?>\n', '')
+                        
+                        # Add element IDs to SVG elements for interactivity, in one pass
+                        values = {
+                            element.id: element.value or ""
+                            for element in page.elements
+                            if isinstance(element, (ShapeModel, ConnectorModel))
+                        }
+                        f.write(_SVG_GROUP_RE.sub(
+                            lambda match: _element_group_tag(match, values), svg_content
+                        ))
+                        f.write('\n')
+                    
+                    f.write('        </div>\n')
+                
+                f.write(_HTML_TAIL)
             
             return True
         
@@ -5,14 +5,127 @@ This module provides services for exporting diagrams to various formats
 including ODP (OpenDocument Presentation), Visio, and other common formats.
 """
 
-import os
-import tempfile
 import zipfile
 import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape as xml_escape
 from typing import Optional, Dict, Any, List, Tuple
 
 from ..model import DiagramModel, PageModel, ElementModel, ShapeModel, ConnectorModel, GroupModel
 
+# lxml builds and serializes the SVG export faster when installed. The ODP
+# export keeps the standard library, as lxml rejects its prefixed tag names.
+try:
+    from lxml import etree as _svg_etree
+    _HAS_LXML = True
+except ImportError:
+    _svg_etree = ET
+    _HAS_LXML = False
+
+_SVG_NS = 'http://www.w3.org/2000/svg'
+_SVG_DECLARATION = b'<?xml version="1.0" encoding="UTF-8" standalone="no"?>\n'
+
+# Fixed parts of the ODP archive
+_ODP_MIMETYPE = b'application/vnd.oasis.opendocument.presentation'
+
+_ODP_MANIFEST = b"""<?xml version="1.0" encoding="UTF-8"?>
+<manifest:manifest xmlns:manifest="urn:oasis:names:tc:opendocument:xmlns:manifest:1.0">
+ <manifest:file-entry manifest:media-type="application/vnd.oasis.opendocument.presentation" manifest:full-path="/"/>
+ <manifest:file-entry manifest:media-type="text/xml" manifest:full-path="content.xml"/>
+ <manifest:file-entry manifest:media-type="text/xml" manifest:full-path="styles.xml"/>
+ <manifest:file-entry manifest:media-type="text/xml" manifest:full-path="meta.xml"/>
+</manifest:manifest>"""
+
+# meta.xml, around the escaped diagram name
+_ODP_META_PREFIX = b"""<?xml version="1.0" encoding="UTF-8"?>
+<office:document-meta xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"
+                     xmlns:dc="http://purl.org/dc/elements/1.1/">
+ <office:meta>
+  <dc:title>"""
+
+_ODP_META_SUFFIX = b"""</dc:title>
+  <dc:creator>PyDiagram</dc:creator>
+  <dc:date>2025-03-27T07:30:00Z</dc:date>
+ </office:meta>
+</office:document-meta>"""
+
+_ODP_STYLES = b"""<?xml version="1.0" encoding="UTF-8"?>
+<office:document-styles xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0">
+ <office:styles>
+  <!-- Basic styles would go here -->
+ </office:styles>
+</office:document-styles>"""
+
+_ODP_CONTENT_DECLARATION = b'<?xml version="1.0" encoding="UTF-8"?>\n'
+
+
+def _shape_center(element: Optional[ElementModel]) -> Optional[Tuple[float, float]]:
+    """Center of a connector endpoint, or None if it is not a shape."""
+    if not isinstance(element, ShapeModel):
+        return None
+    x, y = element.position
+    return (x + element.width/2, y + element.height/2)
+
+
+def _svg_coord(value: float) -> str:
+    """Format a waypoint coordinate (a double), without a fractional part when whole."""
+    if value.is_integer() and abs(value) < 1e16:
+        return str(int(value))
+    return repr(value)
+
+
+def _svg_rect(x, y, width, height):
+    """SVG tag and geometry attributes of a rectangle shape."""
+    return 'rect', {
+        'x': str(x),
+        'y': str(y),
+        'width': str(width),
+        'height': str(height),
+    }
+
+
+def _svg_ellipse(x, y, width, height):
+    """SVG tag and geometry attributes of an ellipse shape."""
+    return 'ellipse', {
+        'cx': str(x + width/2),
+        'cy': str(y + height/2),
+        'rx': str(width/2),
+        'ry': str(height/2),
+    }
+
+
+def _svg_triangle(x, y, width, height):
+    """SVG tag and geometry attributes of a triangle shape (pointing up)."""
+    return 'polygon', {
+        'points': f"{x + width/2},{y} {x},{y + height} {x + width},{y + height}",
+    }
+
+
+def _svg_diamond(x, y, width, height):
+    """SVG tag and geometry attributes of a diamond shape."""
+    center_x = x + width/2
+    center_y = y + height/2
+    return 'polygon', {
+        'points': f"{center_x},{y} {x + width},{center_y} {center_x},{y + height} {x},{center_y}",
+    }
+
+
+_SVG_SHAPE_GEOMETRY = {
+    'rectangle': _svg_rect,
+    'ellipse': _svg_ellipse,
+    'triangle': _svg_triangle,
+    'diamond': _svg_diamond,
+}
+
+# Attributes shared by every arrowhead marker, after its id
+_ARROW_MARKER_ATTRIB = {
+    'viewBox': "0 0 10 10",
+    'refX': "10",
+    'refY': "5",
+    'markerWidth': "6",
+    'markerHeight': "6",
+    'orient': "auto",
+}
+
 
 class ExportService:
     """
@@ -38,27 +151,30 @@ class ExportService:
                 raise ValueError(f"Invalid page index: {page_index}")
             
             page = diagram.pages[page_index]
+            SubElement = _svg_etree.SubElement
             
             # Create the SVG document
-            svg = ET.Element('svg')
-            svg.set('xmlns', 'http://www.w3.org/2000/svg')
+            if _HAS_LXML:
+                svg = _svg_etree.Element('svg', nsmap={None: _SVG_NS})
+            else:
+                svg = _svg_etree.Element('svg')
+                svg.set('xmlns', _SVG_NS)
             svg.set('version', '1.1')
             
-            # Determine the bounds of the diagram
-            min_x, min_y = float('inf'), float('inf')
-            max_x, max_y = float('-inf'), float('-inf')
-            
+            # Determine the bounds of the diagram, one reduction per side. Shapes
+            # are drawn unrotated, so this uses their unrotated geometry rather
+            # than ShapeModel.bounds
+            shape_bounds = []
             for element in page.elements:
-                x, y = element.position
-                
                 if isinstance(element, ShapeModel):
-                    min_x = min(min_x, x)
-                    min_y = min(min_y, y)
-                    max_x = max(max_x, x + element.width)
-                    max_y = max(max_y, y + element.height)
-            
-            # Set reasonable defaults if no elements
-            if min_x == float('inf'):
+                    x, y = element.position
+                    shape_bounds.append((x, y, x + element.width, y + element.height))
+            if shape_bounds:
+                x0s, y0s, x1s, y1s = zip(*shape_bounds)
+                min_x, min_y = min(x0s), min(y0s)
+                max_x, max_y = max(x1s), max(y1s)
+            else:
+                # Set reasonable defaults if no elements
                 min_x, min_y = 0, 0
                 max_x, max_y = 800, 600
             
@@ -77,19 +193,27 @@ class ExportService:
             svg.set('height', f"{height}")
             
             # Add a background rectangle
-            background = ET.SubElement(svg, 'rect')
-            background.set('x', str(min_x))
-            background.set('y', str(min_y))
-            background.set('width', str(width))
-            background.set('height', str(height))
-            background.set('fill', 'white')
+            SubElement(svg, 'rect', {
+                'x': str(min_x),
+                'y': str(min_y),
+                'width': str(width),
+                'height': str(height),
+                'fill': 'white',
+            })
+            
+            # Arrowhead markers by stroke color, created in <defs> on first use
+            defs = None
+            arrow_markers: Dict[str, str] = {}
             
-            # Add each element to the SVG
+            # Centers of connector endpoints, by shape ID
+            centers: Dict[str, Optional[Tuple[float, float]]] = {}
+            
+            # Add each element to the SVG; attributes are passed to SubElement
+            # in one dict, in the order they are serialized
             for element in page.elements:
                 if isinstance(element, ShapeModel):
                     # Create a group for the shape
-                    g = ET.SubElement(svg, 'g')
-                    g.set('id', element.id)
+                    g = SubElement(svg, 'g', {'id': element.id})
                     
                     # Create the shape element
                     shape_type = element.shape_type
@@ -97,90 +221,45 @@ class ExportService:
                     width = element.width
                     height = element.height
                     
-                    if shape_type == 'rectangle':
-                        rect = ET.SubElement(g, 'rect')
-                        rect.set('x', str(x))
-                        rect.set('y', str(y))
-                        rect.set('width', str(width))
-                        rect.set('height', str(height))
-                        rect.set('fill', element.get_style('fillColor', '#ffffff'))
-                        rect.set('stroke', element.get_style('strokeColor', '#000000'))
-                        rect.set('stroke-width', element.get_style('strokeWidth', '1'))
-                        
-                        if element.get_style('rounded', '0') == '1':
-                            rect.set('rx', '5')
-                            rect.set('ry', '5')
+                    # Rectangles are also the default for unknown shapes
+                    geometry = _SVG_SHAPE_GEOMETRY.get(shape_type, _svg_rect)
+                    tag, attrib = geometry(x, y, width, height)
+                    attrib['fill'] = element.get_style('fillColor', '#ffffff')
+                    attrib['stroke'] = element.get_style('strokeColor', '#000000')
+                    attrib['stroke-width'] = element.get_style('strokeWidth', '1')
                     
-                    elif shape_type == 'ellipse':
-                        ellipse = ET.SubElement(g, 'ellipse')
-                        ellipse.set('cx', str(x + width/2))
-                        ellipse.set('cy', str(y + height/2))
-                        ellipse.set('rx', str(width/2))
-                        ellipse.set('ry', str(height/2))
-                        ellipse.set('fill', element.get_style('fillColor', '#ffffff'))
-                        ellipse.set('stroke', element.get_style('strokeColor', '#000000'))
-                        ellipse.set('stroke-width', element.get_style('strokeWidth', '1'))
+                    if shape_type == 'rectangle' and element.get_style('rounded', '0') == '1':
+                        attrib['rx'] = '5'
+                        attrib['ry'] = '5'
                     
-                    elif shape_type == 'triangle':
-                        # Create a triangle (pointing up)
-                        points = f"{x + width/2},{y} {x},{y + height} {x + width},{y + height}"
-                        polygon = ET.SubElement(g, 'polygon')
-                        polygon.set('points', points)
-                        polygon.set('fill', element.get_style('fillColor', '#ffffff'))
-                        polygon.set('stroke', element.get_style('strokeColor', '#000000'))
-                        polygon.set('stroke-width', element.get_style('strokeWidth', '1'))
-                    
-                    elif shape_type == 'diamond':
-                        # Create a diamond
-                        points = f"{x + width/2},{y} {x + width},{y + height/2} {x + width/2},{y + height} {x},{y + height/2}"
-                        polygon = ET.SubElement(g, 'polygon')
-                        polygon.set('points', points)
-                        polygon.set('fill', element.get_style('fillColor', '#ffffff'))
-                        polygon.set('stroke', element.get_style('strokeColor', '#000000'))
-                        polygon.set('stroke-width', element.get_style('strokeWidth', '1'))
-                    
-                    else:
-                        # Default to rectangle for unknown shapes
-                        rect = ET.SubElement(g, 'rect')
-                        rect.set('x', str(x))
-                        rect.set('y', str(y))
-                        rect.set('width', str(width))
-                        rect.set('height', str(height))
-                        rect.set('fill', element.get_style('fillColor', '#ffffff'))
-                        rect.set('stroke', element.get_style('strokeColor', '#000000'))
-                        rect.set('stroke-width', element.get_style('strokeWidth', '1'))
+                    SubElement(g, tag, attrib)
                     
                     # Add text if present
                     if element.value:
-                        text = ET.SubElement(g, 'text')
-                        text.set('x', str(x + width/2))
-                        text.set('y', str(y + height/2))
-                        text.set('text-anchor', 'middle')
-                        text.set('dominant-baseline', 'middle')
-                        text.set('font-family', 'Arial')
-                        text.set('font-size', '12')
+                        text = SubElement(g, 'text', {
+                            'x': str(x + width/2),
+                            'y': str(y + height/2),
+                            'text-anchor': 'middle',
+                            'dominant-baseline': 'middle',
+                            'font-family': 'Arial',
+                            'font-size': '12',
+                        })
                         text.text = element.value
                 
                 elif isinstance(element, ConnectorModel):
                     # Create a group for the connector
-                    g = ET.SubElement(svg, 'g')
-                    g.set('id', element.id)
+                    g = SubElement(svg, 'g', {'id': element.id})
                     
-                    # Get source and target positions
-                    source_pos = None
-                    target_pos = None
+                    # Get source and target positions, computing each shape center once
+                    source_id = element.source_id
+                    source_pos = centers.get(source_id)
+                    if source_pos is None and source_id:
+                        source_pos = centers[source_id] = _shape_center(page.get_element_by_id(source_id))
                     
-                    if element.source_id:
-                        source_element = next((e for e in page.elements if e.id == element.source_id), None)
-                        if source_element and isinstance(source_element, ShapeModel):
-                            sx, sy = source_element.position
-                            source_pos = (sx + source_element.width/2, sy + source_element.height/2)
-                    
-                    if element.target_id:
-                        target_element = next((e for e in page.elements if e.id == element.target_id), None)
-                        if target_element and isinstance(target_element, ShapeModel):
-                            tx, ty = target_element.position
-                            target_pos = (tx + target_element.width/2, ty + target_element.height/2)
+                    target_id = element.target_id
+                    target_pos = centers.get(target_id)
+                    if target_pos is None and target_id:
+                        target_pos = centers[target_id] = _shape_center(page.get_element_by_id(target_id))
                     
                     # Use element position if source/target not found
                     if not source_pos:
@@ -190,44 +269,45 @@ class ExportService:
                         x, y = element.position
                         target_pos = (x + 100, y)  # Default offset
                     
-                    # Create the path for the connector
-                    path = ET.SubElement(g, 'path')
-                    
                     # Generate the path data
                     waypoints = element.waypoints
                     if waypoints:
                         # Use waypoints if available
-                        path_data = f"M {source_pos[0]},{source_pos[1]}"
-                        for wx, wy in waypoints:
-                            path_data += f" L {wx},{wy}"
-                        path_data += f" L {target_pos[0]},{target_pos[1]}"
+                        path_parts = [f"M {source_pos[0]},{source_pos[1]}"]
+                        path_parts.extend([f"L {_svg_coord(wx)},{_svg_coord(wy)}" for wx, wy in waypoints])
+                        path_parts.append(f"L {target_pos[0]},{target_pos[1]}")
+                        path_data = ' '.join(path_parts)
                     else:
                         # Simple straight line
                         path_data = f"M {source_pos[0]},{source_pos[1]} L {target_pos[0]},{target_pos[1]}"
                     
-                    path.set('d', path_data)
-                    path.set('fill', 'none')
-                    path.set('stroke', element.get_style('strokeColor', '#000000'))
-                    path.set('stroke-width', element.get_style('strokeWidth', '1'))
+                    stroke = element.get_style('strokeColor', '#000000')
+                    path_attrib = {
+                        'd': path_data,
+                        'fill': 'none',
+                        'stroke': stroke,
+                        'stroke-width': element.get_style('strokeWidth', '1'),
+                    }
                     
                     # Add arrowheads if specified
                     end_arrow = element.get_style('endArrow', 'none')
                     if end_arrow != 'none':
-                        # Simple arrowhead
-                        marker = ET.SubElement(svg, 'marker')
-                        marker.set('id', f"arrow_{element.id}")
-                        marker.set('viewBox', "0 0 10 10")
-                        marker.set('refX', "10")
-                        marker.set('refY', "5")
-                        marker.set('markerWidth', "6")
-                        marker.set('markerHeight', "6")
-                        marker.set('orient', "auto")
-                        
-                        arrow = ET.SubElement(marker, 'path')
-                        arrow.set('d', "M 0,0 L 10,5 L 0,10 z")
-                        arrow.set('fill', element.get_style('strokeColor', '#000000'))
+                        # Simple arrowhead, shared by all connectors of the same color
+                        marker_id = arrow_markers.get(stroke)
+                        if marker_id is None:
+                            if defs is None:
+                                # Right after the background rectangle
+                                defs = svg.makeelement('defs', {})
+                                svg.insert(1, defs)
+                            
+                            marker_id = arrow_markers[stroke] = f"arrow_{len(arrow_markers)}"
+                            marker = SubElement(defs, 'marker', {'id': marker_id, **_ARROW_MARKER_ATTRIB})
+                            SubElement(marker, 'path', {'d': "M 0,0 L 10,5 L 0,10 z", 'fill': stroke})
                         
-                        path.set('marker-end', f"url(#arrow_{element.id})")
+                        path_attrib['marker-end'] = f"url(#{marker_id})"
+                    
+                    # Create the path for the connector
+                    SubElement(g, 'path', path_attrib)
                     
                     # Add text if present
                     if element.value:
@@ -236,33 +316,32 @@ class ExportService:
                             # Use middle waypoint
                             mid_idx = len(waypoints) // 2
                             mid_x, mid_y = waypoints[mid_idx]
+                            mid_x, mid_y = _svg_coord(mid_x), _svg_coord(mid_y)
                         else:
                             # Calculate midpoint of line
-                            mid_x = (source_pos[0] + target_pos[0]) / 2
-                            mid_y = (source_pos[1] + target_pos[1]) / 2
+                            mid_x = str((source_pos[0] + target_pos[0]) / 2)
+                            mid_y = str((source_pos[1] + target_pos[1]) / 2)
                         
-                        text = ET.SubElement(g, 'text')
-                        text.set('x', str(mid_x))
-                        text.set('y', str(mid_y))
-                        text.set('text-anchor', 'middle')
-                        text.set('dominant-baseline', 'middle')
-                        text.set('font-family', 'Arial')
-                        text.set('font-size', '12')
-                        text.set('fill', element.get_style('fontColor', '#000000'))
-                        text.set('background', 'white')
+                        text = SubElement(g, 'text', {
+                            'x': mid_x,
+                            'y': mid_y,
+                            'text-anchor': 'middle',
+                            'dominant-baseline': 'middle',
+                            'font-family': 'Arial',
+                            'font-size': '12',
+                            'fill': element.get_style('fontColor', '#000000'),
+                            'background': 'white',
+                        })
                         text.text = element.value
             
-            # Convert to string
-            svg_string = ET.tostring(svg, encoding='utf-8').decode('utf-8')
-            
-            # Save to file if path provided
+            # Save to file if path provided, serialized straight into the file
             if file_path:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write('<?xml version="1.0" encoding="UTF-8" standalone="no"?>\n')
-                    f.write(svg_string)
+                with open(file_path, 'wb') as f:
+                    f.write(_SVG_DECLARATION)
+                    _svg_etree.ElementTree(svg).write(f, encoding='utf-8')
                 return None
             
-            return svg_string
+            return _svg_etree.tostring(svg, encoding='unicode')
         
         except Exception as e:
             print(f"Error exporting to SVG: {e}")
@@ -281,159 +360,126 @@ class ExportService:
             True if exporting was successful, False otherwise
         """
         try:
-            # Create a temporary directory for ODP files
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Create the basic ODP structure
-                os.makedirs(os.path.join(temp_dir, 'META-INF'), exist_ok=True)
-                
-                # Create the manifest file
-                manifest_content = """<?xml version="1.0" encoding="UTF-8"?>
-<manifest:manifest xmlns:manifest="urn:oasis:names:tc:opendocument:xmlns:manifest:1.0">
- <manifest:file-entry manifest:media-type="application/vnd.oasis.opendocument.presentation" manifest:full-path="/"/>
- <manifest:file-entry manifest:media-type="text/xml" manifest:full-path="content.xml"/>
- <manifest:file-entry manifest:media-type="text/xml" manifest:full-path="styles.xml"/>
- <manifest:file-entry manifest:media-type="text/xml" manifest:full-path="meta.xml"/>
-</manifest:manifest>"""
-                
-                with open(os.path.join(temp_dir, 'META-INF', 'manifest.xml'), 'w', encoding='utf-8') as f:
-                    f.write(manifest_content)
-                
-                # Create the meta.xml file
-                meta_content = """<?xml version="1.0" encoding="UTF-8"?>
-<office:document-meta xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"
-                     xmlns:dc="http://purl.org/dc/elements/1.1/">
- <office:meta>
-  <dc:title>""" + diagram.name + """</dc:title>
-  <dc:creator>PyDiagram</dc:creator>
-  <dc:date>2025-03-27T07:30:00Z</dc:date>
- </office:meta>
-</office:document-meta>"""
-                
-                with open(os.path.join(temp_dir, 'meta.xml'), 'w', encoding='utf-8') as f:
-                    f.write(meta_content)
-                
-                # Create the styles.xml file
-                styles_content = """<?xml version="1.0" encoding="UTF-8"?>
-<office:document-styles xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0">
- <office:styles>
-  <!-- Basic styles would go here -->
- </office:styles>
-</office:document-styles>"""
-                
-                with open(os.path.join(temp_dir, 'styles.xml'), 'w', encoding='utf-8') as f:
-                    f.write(styles_content)
-                
-                # Create the content.xml file with slides for each page
-                content = ET.Element('office:document-content')
-                content.set('xmlns:office', 'urn:oasis:names:tc:opendocument:xmlns:office:1.0')
-                content.set('xmlns:draw', 'urn:oasis:names:tc:opendocument:xmlns:drawing:1.0')
-                content.set('xmlns:text', 'urn:oasis:names:tc:opendocument:xmlns:text:1.0')
-                content.set('xmlns:svg', 'urn:oasis:names:tc:opendocument:xmlns:svg-compatible:1.0')
-                
-                # Add automatic styles
-                auto_styles = ET.SubElement(content, 'office:automatic-styles')
-                
-                # Add body
-                body = ET.SubElement(content, 'office:body')
-                presentation = ET.SubElement(body, 'office:presentation')
+            SubElement = ET.SubElement
+            
+            # Create the content.xml file with slides for each page
+            content = ET.Element('office:document-content')
+            content.set('xmlns:office', 'urn:oasis:names:tc:opendocument:xmlns:office:1.0')
+            content.set('xmlns:draw', 'urn:oasis:names:tc:opendocument:xmlns:drawing:1.0')
+            content.set('xmlns:text', 'urn:oasis:names:tc:opendocument:xmlns:text:1.0')
+            content.set('xmlns:svg', 'urn:oasis:names:tc:opendocument:xmlns:svg-compatible:1.0')
+            
+            # Add automatic styles
+            auto_styles = SubElement(content, 'office:automatic-styles')
+            
+            # Add body
+            body = SubElement(content, 'office:body')
+            presentation = SubElement(body, 'office:presentation')
+            
+            # Collect the per-element styles and attach them in one go
+            style_nodes = []
+            Element = ET.Element
+            
+            # Add a slide for each page
+            for i, page in enumerate(diagram.pages):
+                # Create a slide
+                slide = SubElement(presentation, 'draw:page')
+                slide.set('draw:name', page.name)
+                slide.set('draw:style-name', f'dp{i}')
                 
-                # Add a slide for each page
-                for i, page in enumerate(diagram.pages):
-                    # Create a slide
-                    slide = ET.SubElement(presentation, 'draw:page')
-                    slide.set('draw:name', page.name)
-                    slide.set('draw:style-name', f'dp{i}')
+                # Add each element to the slide
+                for element in page.elements:
+                    if isinstance(element, ShapeModel):
+                        # Create a shape
+                        shape_type = element.shape_type
+                        x, y = element.position
+                        width = element.width
+                        height = element.height
+                        
+                        if shape_type == 'rectangle':
+                            shape = SubElement(slide, 'draw:rect')
+                        elif shape_type == 'ellipse':
+                            shape = SubElement(slide, 'draw:ellipse')
+                        else:
+                            # Default to rectangle for other shapes
+                            shape = SubElement(slide, 'draw:rect')
+                        
+                        # Set position and size
+                        shape.set('svg:x', f"{x/100}cm")
+                        shape.set('svg:y', f"{y/100}cm")
+                        shape.set('svg:width', f"{width/100}cm")
+                        shape.set('svg:height', f"{height/100}cm")
+                        
+                        # Set style
+                        fill_color = element.get_style('fillColor', '#ffffff')
+                        stroke_color = element.get_style('strokeColor', '#000000')
+                        
+                        shape.set('draw:style-name', f'gr{i}_{element.id}')
+                        
+                        # Add style for this shape
+                        style = Element('style:style', {
+                            'style:name': f'gr{i}_{element.id}',
+                            'style:family': 'graphic',
+                        })
+                        SubElement(style, 'style:graphic-properties', {
+                            'draw:fill-color': fill_color,
+                            'svg:stroke-color': stroke_color,
+                        })
+                        style_nodes.append(style)
+                        
+                        # Add text if present
+                        if element.value:
+                            text_box = SubElement(shape, 'draw:text-box')
+                            p = SubElement(text_box, 'text:p')
+                            p.text = element.value
                     
-                    # Add each element to the slide
-                    for element in page.elements:
-                        if isinstance(element, ShapeModel):
-                            # Create a shape
-                            shape_type = element.shape_type
-                            x, y = element.position
-                            width = element.width
-                            height = element.height
-                            
-                            if shape_type == 'rectangle':
-                                shape = ET.SubElement(slide, 'draw:rect')
-                            elif shape_type == 'ellipse':
-                                shape = ET.SubElement(slide, 'draw:ellipse')
-                            else:
-                                # Default to rectangle for other shapes
-                                shape = ET.SubElement(slide, 'draw:rect')
-                            
-                            # Set position and size
-                            shape.set('svg:x', f"{x/100}cm")
-                            shape.set('svg:y', f"{y/100}cm")
-                            shape.set('svg:width', f"{width/100}cm")
-                            shape.set('svg:height', f"{height/100}cm")
-                            
-                            # Set style
-                            fill_color = element.get_style('fillColor', '#ffffff')
-                            stroke_color = element.get_style('strokeColor', '#000000')
-                            
-                            shape.set('draw:style-name', f'gr{i}_{element.id}')
-                            
-                            # Add style for this shape
-                            style = ET.SubElement(auto_styles, 'style:style')
-                            style.set('style:name', f'gr{i}_{element.id}')
-                            style.set('style:family', 'graphic')
-                            
-                            props = ET.SubElement(style, 'style:graphic-properties')
-                            props.set('draw:fill-color', fill_color)
-                            props.set('svg:stroke-color', stroke_color)
-                            
-                            # Add text if present
-                            if element.value:
-                                text_box = ET.SubElement(shape, 'draw:text-box')
-                                p = ET.SubElement(text_box, 'text:p')
-                                p.text = element.value
+                    elif isinstance(element, ConnectorModel):
+                        # Create a connector
+                        connector = SubElement(slide, 'draw:connector')
+                        connector.set('draw:style-name', f'gr{i}_{element.id}')
                         
-                        elif isinstance(element, ConnectorModel):
-                            # Create a connector
-                            connector = ET.SubElement(slide, 'draw:connector')
-                            connector.set('draw:style-name', f'gr{i}_{element.id}')
-                            
-                            # Set source and target
-                            if element.source_id:
-                                connector.set('draw:start-shape', element.source_id)
-                            if element.target_id:
-                                connector.set('draw:end-shape', element.target_id)
-                            
-                            # Add style for this connector
-                            style = ET.SubElement(auto_styles, 'style:style')
-                            style.set('style:name', f'gr{i}_{element.id}')
-                            style.set('style:family', 'graphic')
-                            
-                            props = ET.SubElement(style, 'style:graphic-properties')
-                            props.set('svg:stroke-color', element.get_style('strokeColor', '#000000'))
-                            
-                            # Add text if present
-                            if element.value:
-                                text_box = ET.SubElement(connector, 'draw:text-box')
-                                p = ET.SubElement(text_box, 'text:p')
-                                p.text = element.value
-                
-                # Write the content.xml file
-                content_string = ET.tostring(content, encoding='utf-8').decode('utf-8')
-                with open(os.path.join(temp_dir, 'content.xml'), 'w', encoding='utf-8') as f:
-                    f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-                    f.write(content_string)
+                        # Set source and target
+                        if element.source_id:
+                            connector.set('draw:start-shape', element.source_id)
+                        if element.target_id:
+                            connector.set('draw:end-shape', element.target_id)
+                        
+                        # Add style for this connector
+                        style = Element('style:style', {
+                            'style:name': f'gr{i}_{element.id}',
+                            'style:family': 'graphic',
+                        })
+                        SubElement(style, 'style:graphic-properties', {
+                            'svg:stroke-color': element.get_style('strokeColor', '#000000'),
+                        })
+                        style_nodes.append(style)
+                        
+                        # Add text if present
+                        if element.value:
+                            text_box = SubElement(connector, 'draw:text-box')
+                            p = SubElement(text_box, 'text:p')
+                            p.text = element.value
+            
+            auto_styles.extend(style_nodes)
+            
+            # Write the ODP file (zip) straight from memory, deflating everything
+            # but the mimetype
+            with zipfile.ZipFile(file_path, 'w', compression=zipfile.ZIP_DEFLATED,
+                                 compresslevel=3) as odp_zip:
+                # Add mimetype first (uncompressed)
+                odp_zip.writestr('mimetype', _ODP_MIMETYPE, compress_type=zipfile.ZIP_STORED)
                 
-                # Create the mimetype file
-                with open(os.path.join(temp_dir, 'mimetype'), 'w', encoding='utf-8') as f:
-                    f.write('application/vnd.oasis.opendocument.presentation')
+                # Add other files
+                odp_zip.writestr('META-INF/manifest.xml', _ODP_MANIFEST)
+                odp_zip.writestr('meta.xml', _ODP_META_PREFIX
+                                 + xml_escape(diagram.name).encode('utf-8')
+                                 + _ODP_META_SUFFIX)
+                odp_zip.writestr('styles.xml', _ODP_STYLES)
                 
-                # Create the ODP file (zip)
-                with zipfile.ZipFile(file_path, 'w') as odp_zip:
-                    # Add mimetype first (uncompressed)
-                    odp_zip.write(os.path.join(temp_dir, 'mimetype'), 'mimetype', compress_type=zipfile.ZIP_STORED)
-                    
-                    # Add other files
-                    for root, dirs, files in os.walk(temp_dir):
-                        for file in files:
-                            if file != 'mimetype':
-                                file_path_in_zip = os.path.relpath(os.path.join(root, file), temp_dir)
-                                odp_zip.write(os.path.join(root, file), file_path_in_zip)
+                # Serialize the content straight into the compressed entry
+                with odp_zip.open('content.xml', 'w') as f:
+                    f.write(_ODP_CONTENT_DECLARATION)
+                    ET.ElementTree(content).write(f, encoding='utf-8')
             
             return True
         
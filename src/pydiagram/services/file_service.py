@@ -2,10 +2,11 @@
 PyDiagram - File service module
 
 This module provides services for loading and saving diagram files
-using the extended drawpyo functionality.
+using the built-in drawio reader and writer.
 """
 
 import os
+import functools
 from typing import Optional
 
 from ..model import DiagramModel
@@ -46,6 +47,7 @@ class FileService:
         return DrawpyoIntegration.save_drawio_file(diagram, file_path)
     
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def get_file_extension(file_path: str) -> str:
         """
         Get the file extension from a file path.
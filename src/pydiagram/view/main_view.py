@@ -472,7 +472,7 @@ class DiagramView(QWidget):
                     new_y = y + delta_y
                     
                     if self._controller:
-                        self._controller.move_element(element, new_x, new_y)
+                        self._controller.move_element(element, new_x, new_y, (x, y))
             
             # Update drag start for next move
             self._drag_start = pos
@@ -504,11 +504,11 @@ class DiagramView(QWidget):
                 else:
                     self._temp_shape.target_id = None
                     # Add waypoint at current position
-                    if not self._temp_shape.waypoints:
+                    if not self._temp_shape.waypoint_count:
                         self._temp_shape.add_waypoint(pos.x(), pos.y())
                     else:
                         # Update last waypoint
-                        self._temp_shape._waypoints[-1] = (pos.x(), pos.y())
+                        self._temp_shape.set_waypoint(-1, pos.x(), pos.y())
             
             self.update()
     
@@ -987,7 +987,7 @@ class MainWindow(QMainWindow):
         
         # Select current page
         if self._controller.current_page:
-            index = self._diagram.pages.index(self._controller.current_page)
+            index = self._diagram.page_index(self._controller.current_page)
             self.pages_list.setCurrentRow(index)
     
     def _page_selected(self, item):
@@ -1114,7 +1114,7 @@ class MainWindow(QMainWindow):
                 file_path += '.svg'
             
             # Get current page index
-            page_index = self._diagram.pages.index(self._controller.current_page)
+            page_index = self._diagram.page_index(self._controller.current_page)
             
             # Export to SVG
             success = ExportService.export_to_svg(self._diagram, page_index, file_path) is not None
@@ -1177,8 +1177,7 @@ class MainWindow(QMainWindow):
     def _delete(self):
         """Delete the selected elements."""
         if self._controller:
-            for element in self.diagram_view._selected_elements.copy():
-                self._controller.remove_element(element)
+            self._controller.remove_elements(self.diagram_view._selected_elements)
             
             self.diagram_view._selected_elements.clear()
             self.diagram_view.update()
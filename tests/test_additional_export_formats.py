@@ -0,0 +1,52 @@
+"""
+Tests for the additional export formats.
+"""
+
+import re
+
+import pytest
+
+from pydiagram.model import DiagramModel, PageModel, ShapeModel
+from pydiagram.services import additional_export_formats
+from pydiagram.services.additional_export_formats import AdditionalExportFormats
+
+requires_cairosvg = pytest.mark.skipif(additional_export_formats.cairosvg is None,
+                                       reason="cairosvg (or the cairo library) is not installed")
+
+
+def _two_page_diagram():
+    diagram = DiagramModel("test")
+    for n in range(2):
+        page = PageModel(f"page{n}")
+        diagram.add_page(page)
+        page.add_element(ShapeModel(f"s{n}", shape_type="ellipse"))
+    return diagram
+
+
+def _pdf_page_count(path):
+    with open(path, 'rb') as f:
+        return len(re.findall(rb'/Type\s*/Page\b', f.read()))
+
+
+@requires_cairosvg
+def test_export_to_pdf_single_document(tmp_path, monkeypatch):
+    # One process: every page is drawn into the same cairo document
+    monkeypatch.setattr(additional_export_formats.os, 'cpu_count', lambda: 1)
+    path = str(tmp_path / "out.pdf")
+    
+    assert AdditionalExportFormats.export_to_pdf(_two_page_diagram(), path)
+    assert _pdf_page_count(path) == 2
+
+
+@requires_cairosvg
+@pytest.mark.skipif(additional_export_formats.PdfMerger is None, reason="PyPDF2 is not installed")
+def test_export_to_pdf_falls_back_when_surface_api_changes(tmp_path, monkeypatch):
+    def changed_api(pages, file_obj):
+        raise AttributeError("_create_surface")
+    
+    monkeypatch.setattr(additional_export_formats.os, 'cpu_count', lambda: 1)
+    monkeypatch.setattr(additional_export_formats, '_svg_pages_to_pdf', changed_api)
+    path = str(tmp_path / "out.pdf")
+    
+    assert AdditionalExportFormats.export_to_pdf(_two_page_diagram(), path)
+    assert _pdf_page_count(path) == 2
@@ -0,0 +1,53 @@
+"""
+Tests for the command history.
+"""
+
+import gc
+import weakref
+
+from pydiagram.controller.commands import CommandManager
+from pydiagram.controller.diagram_controller import AddShapeCommand, DiagramController
+from pydiagram.model import DiagramModel, PageModel, ShapeModel
+
+
+def _controller():
+    diagram = DiagramModel("test")
+    diagram.add_page(PageModel("page"))
+    return DiagramController(diagram)
+
+
+def test_clear_history_releases_models():
+    controller = _controller()
+    shape = controller.add_shape("rectangle", 0, 0)
+    controller.remove_element(shape)
+    shape_ref = weakref.ref(shape)
+    del shape
+    
+    # Released commands are pooled, but must not keep the removed shape alive
+    controller.command_manager.clear_history()
+    gc.collect()
+    
+    assert shape_ref() is None
+
+
+def test_undo_add_with_duplicate_id_keeps_existing_element():
+    controller = _controller()
+    page = controller.current_page
+    existing = ShapeModel("dup")
+    page.add_element(existing)
+    
+    command = AddShapeCommand(page, ShapeModel("dup"))
+    controller.command_manager.execute_command(command)
+    controller.command_manager.undo()
+    
+    assert page.elements == (existing,)
+
+
+def test_zero_max_history_keeps_no_commands():
+    manager = CommandManager(max_history=0)
+    page = PageModel("page")
+    
+    manager.execute_command(AddShapeCommand(page, ShapeModel("s1")))
+    
+    assert len(page.elements) == 1
+    assert not manager.can_undo()
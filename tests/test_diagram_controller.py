@@ -0,0 +1,20 @@
+"""
+Tests for the diagram controller.
+"""
+
+from pydiagram.controller.diagram_controller import DiagramController
+from pydiagram.model import DiagramModel, PageModel
+
+
+def test_selection_view_stays_live_across_new_diagram():
+    diagram = DiagramModel("test")
+    diagram.add_page(PageModel("page"))
+    controller = DiagramController(diagram)
+    selection = controller.selection
+    
+    controller.select_element(controller.add_shape("rectangle", 0, 0))
+    controller.create_new_diagram()
+    shape = controller.add_shape("ellipse", 0, 0)
+    controller.select_element(shape)
+    
+    assert list(selection) == [shape]
@@ -0,0 +1,156 @@
+"""
+Tests for loading and saving drawio files.
+"""
+
+import base64
+import xml.etree.ElementTree
+import zlib
+from urllib.parse import quote
+
+import pytest
+
+from pydiagram.integration import drawpyo_integration
+from pydiagram.integration.drawpyo_integration import DrawpyoIntegration
+from pydiagram.model import ConnectorModel, DiagramModel, GroupModel, PageModel, ShapeModel
+
+
+@pytest.fixture(params=['lxml', 'etree'])
+def backend(request, monkeypatch):
+    """Run the test with lxml and with the standard library ElementTree."""
+    if request.param == 'lxml':
+        if not drawpyo_integration._HAS_LXML:
+            pytest.skip("lxml is not installed")
+    else:
+        monkeypatch.setattr(drawpyo_integration, 'ET', xml.etree.ElementTree)
+        monkeypatch.setattr(drawpyo_integration, '_HAS_LXML', False)
+    return request.param
+
+
+def _reload(diagram, tmp_path):
+    path = str(tmp_path / "test.drawio")
+    assert DrawpyoIntegration.save_drawio_file(diagram, path)
+    loaded = DrawpyoIntegration.load_drawio_file(path)
+    assert loaded is not None
+    return loaded
+
+
+def test_escaped_characters_round_trip(backend, tmp_path):
+    diagram = DiagramModel("test")
+    page = PageModel('P & "Q" <1>')
+    diagram.add_page(page)
+    shape = ShapeModel("s1", 'a & <b> "c"')
+    page.add_element(shape)
+    shape.set_style("label", 'x & <y> "z"')
+    
+    loaded = _reload(diagram, tmp_path)
+    
+    loaded_page = loaded.pages[0]
+    loaded_shape = loaded_page.get_element_by_id("s1")
+    assert loaded_page.name == 'P & "Q" <1>'
+    assert loaded_shape.value == 'a & <b> "c"'
+    assert loaded_shape.get_style("label") == 'x & <y> "z"'
+
+
+def test_plain_page_round_trip(backend, tmp_path):
+    diagram = DiagramModel("test")
+    for name in ("first", "second"):
+        diagram.add_page(PageModel(name))
+    shape = ShapeModel("s1", "label", "ellipse")
+    diagram.pages[1].add_element(shape)
+    shape.position = (10, 20.5)
+    shape.set_size(120, 80)
+    shape.set_style("fillColor", "#ff0000")
+    
+    loaded = _reload(diagram, tmp_path)
+    
+    assert [page.name for page in loaded.pages] == ["first", "second"]
+    assert loaded.pages[0].elements == ()
+    loaded_shape = loaded.pages[1].get_element_by_id("s1")
+    assert isinstance(loaded_shape, ShapeModel)
+    assert loaded_shape.shape_type == "ellipse"
+    assert loaded_shape.value == "label"
+    assert loaded_shape.position == (10, 20.5)
+    assert (loaded_shape.width, loaded_shape.height) == (120, 80)
+    assert loaded_shape.get_style("fillColor") == "#ff0000"
+
+
+def test_compressed_page(backend, tmp_path):
+    graph_model = ('<mxGraphModel><root><mxCell id="0"/><mxCell id="1" parent="0"/>'
+                   '<mxCell id="s1" value="a &amp; b" style="rhombus;fillColor=#00ff00" '
+                   'parent="1" vertex="1"><mxGeometry x="5" y="6" width="30" height="40" '
+                   'as="geometry"/></mxCell></root></mxGraphModel>')
+    # drawio URL-quotes the XML, deflates it without a header and base64 encodes it
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    deflated = compressor.compress(quote(graph_model).encode('ascii')) + compressor.flush()
+    path = tmp_path / "compressed.drawio"
+    path.write_text('<mxfile><diagram id="d" name="Page &amp; 1">%s</diagram></mxfile>'
+                    % base64.b64encode(deflated).decode('ascii'))
+    
+    loaded = DrawpyoIntegration.load_drawio_file(str(path))
+    
+    assert loaded.pages[0].name == "Page & 1"
+    shape = loaded.pages[0].get_element_by_id("s1")
+    assert shape.shape_type == "diamond"
+    assert shape.value == "a & b"
+    assert shape.position == (5, 6)
+    assert shape.get_style("fillColor") == "#00ff00"
+    
+    # Saved back uncompressed, it reloads the same
+    reloaded_shape = _reload(loaded, tmp_path).pages[0].get_element_by_id("s1")
+    assert (reloaded_shape.value, reloaded_shape.position) == ("a & b", (5, 6))
+
+
+def test_connector_waypoints_round_trip(backend, tmp_path):
+    diagram = DiagramModel("test")
+    page = PageModel("page")
+    diagram.add_page(page)
+    for element_id in ("s1", "s2"):
+        page.add_element(ShapeModel(element_id))
+    connector = ConnectorModel("c1", "flow", source_id="s1", target_id="s2")
+    connector.add_waypoint(10, 20)
+    connector.add_waypoint(30.5, 40)
+    connector.set_style("endArrow", "classic")
+    page.add_element(connector)
+    
+    loaded = _reload(diagram, tmp_path).pages[0].get_element_by_id("c1")
+    
+    assert isinstance(loaded, ConnectorModel)
+    assert (loaded.source_id, loaded.target_id) == ("s1", "s2")
+    assert loaded.value == "flow"
+    assert loaded.waypoints == ((10, 20), (30.5, 40))
+    assert loaded.get_style("endArrow") == "classic"
+
+
+def test_group_round_trip(backend, tmp_path):
+    diagram = DiagramModel("test")
+    page = PageModel("page")
+    diagram.add_page(page)
+    outer = GroupModel("g1", "outer")
+    outer.position = (100, 50)
+    inner = GroupModel("g2")
+    inner.position = (110, 60)
+    shape = ShapeModel("s1")
+    shape.position = (120, 70)
+    connector = ConnectorModel("c1", source_id="s1", target_id="s1")
+    connector.add_waypoint(150, 90)
+    for element in (outer, inner, shape, connector):
+        page.add_element(element)
+    outer.add_child("g2")
+    outer.add_child("c1")
+    inner.add_child("s1")
+    
+    loaded_page = _reload(diagram, tmp_path).pages[0]
+    
+    loaded_outer = loaded_page.get_element_by_id("g1")
+    loaded_inner = loaded_page.get_element_by_id("g2")
+    assert isinstance(loaded_outer, GroupModel) and isinstance(loaded_inner, GroupModel)
+    assert loaded_outer.value == "outer"
+    assert loaded_outer.children_ids == ("g2", "c1")
+    assert loaded_inner.children_ids == ("s1",)
+    assert loaded_page.get_element_by_id("s1").parent_id == "g2"
+    
+    # Positions are absolute in the model, relative to the group in the file
+    assert loaded_outer.position == (100, 50)
+    assert loaded_inner.position == (110, 60)
+    assert loaded_page.get_element_by_id("s1").position == (120, 70)
+    assert loaded_page.get_element_by_id("c1").waypoints == ((150, 90),)
@@ -0,0 +1,41 @@
+"""
+Tests for the export service.
+"""
+
+from pydiagram.model import ConnectorModel, DiagramModel, PageModel, ShapeModel
+from pydiagram.services.export_service import ExportService
+
+
+def _single_shape_diagram(width, height, rotation=0.0):
+    diagram = DiagramModel("test")
+    page = PageModel("page")
+    diagram.add_page(page)
+    shape = ShapeModel("s1")
+    page.add_element(shape)
+    shape.position = (0, 0)
+    shape.width = width
+    shape.height = height
+    shape.rotation = rotation
+    return diagram
+
+
+def test_svg_viewbox_ignores_rotation():
+    # Shapes are drawn unrotated, so the viewBox must contain the unrotated shape
+    svg = ExportService.export_to_svg(_single_shape_diagram(200, 10, rotation=90))
+    unrotated = ExportService.export_to_svg(_single_shape_diagram(200, 10))
+    
+    assert 'viewBox="-20 -20 240 50"' in unrotated
+    assert 'viewBox="-20 -20 240 50"' in svg
+
+
+def test_svg_waypoints_keep_integral_coordinates():
+    diagram = _single_shape_diagram(100, 60)
+    connector = ConnectorModel("c1", "label", source_id="s1", target_id="s1")
+    connector.add_waypoint(10, 20)
+    connector.add_waypoint(30.5, 40)
+    diagram.pages[0].add_element(connector)
+    
+    svg = ExportService.export_to_svg(diagram)
+    
+    assert "L 10,20 L 30.5,40 " in svg
+    assert 'x="30.5" y="40"' in svg
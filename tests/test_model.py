@@ -0,0 +1,108 @@
+"""
+Tests for the model classes and their observer dispatch.
+"""
+
+from pydiagram.model import ModelObserver, ShapeModel
+
+
+class _Recorder(ModelObserver):
+    def __init__(self):
+        self.changes = []
+    
+    def model_changed(self, model, change_type, data):
+        self.changes.append((change_type, data))
+
+
+def test_observer_interests_filter_change_types():
+    shape = ShapeModel("s1")
+    everything = _Recorder()
+    values_only = _Recorder()
+    shape.add_observer(everything)
+    shape.add_observer(values_only, interests=['value_changed'])
+    
+    shape.value = "text"
+    shape.position = (10, 20)
+    
+    assert [change_type for change_type, _ in everything.changes] == ['value_changed', 'position_changed']
+    assert values_only.changes == [('value_changed', {'old_value': '', 'new_value': 'text'})]
+
+
+def test_observer_level_skips_lower_notifications():
+    shape = ShapeModel("s1")
+    low = _Recorder()
+    high = _Recorder()
+    shape.add_observer(low)
+    shape.add_observer(high, level=2)
+    
+    shape.notify_observers('custom', 'minor', level=1)
+    shape.notify_observers('custom', 'major', level=2)
+    
+    assert low.changes == [('custom', 'minor'), ('custom', 'major')]
+    assert high.changes == [('custom', 'major')]
+
+
+def test_observer_callback_replaces_model_changed():
+    shape = ShapeModel("s1")
+    observer = _Recorder()
+    calls = []
+    shape.add_observer(observer, callback=lambda model, change_type, data: calls.append(change_type))
+    
+    shape.value = "text"
+    
+    assert calls == ['value_changed']
+    assert observer.changes == []
+
+
+def test_locked_notifications_are_coalesced_and_sent_on_unlock():
+    shape = ShapeModel("s1")
+    observer = _Recorder()
+    shape.add_observer(observer)
+    
+    shape.lock_observers()
+    shape.position = (1, 1)
+    shape.set_style('fillColor', '#111111')
+    shape.position = (2, 2)
+    shape.set_style('strokeColor', '#222222')
+    shape.set_style('fillColor', '#333333')
+    assert observer.changes == []
+    shape.unlock_observers()
+    
+    # One notification per (change type, key), in the position of the last,
+    # keeping the old values of the first
+    assert observer.changes == [
+        ('position_changed', {'old_position': (0, 0), 'new_position': (2, 2)}),
+        ('style_changed', {'key': 'strokeColor', 'old_value': '#000000', 'new_value': '#222222'}),
+        ('style_changed', {'key': 'fillColor', 'old_value': '#ffffff', 'new_value': '#333333'}),
+    ]
+
+
+def test_nested_locks_wait_for_the_outermost_unlock():
+    shape = ShapeModel("s1")
+    observer = _Recorder()
+    shape.add_observer(observer)
+    
+    with shape.batch_notifications():
+        with shape.batch_notifications():
+            shape.value = "a"
+        assert observer.changes == []
+        shape.value = "b"
+    
+    assert observer.changes == [('value_changed', {'old_value': '', 'new_value': 'b'})]
+
+
+def test_apply_style_string_sends_style_changed_per_key():
+    shape = ShapeModel("s1")
+    observer = _Recorder()
+    shape.add_observer(observer)
+    
+    shape.apply_style_string("fillColor=#ff0000;strokeColor=#000000;dashed=1")
+    
+    # strokeColor already had that value
+    assert observer.changes == [
+        ('style_changed', {'key': 'fillColor', 'old_value': '#ffffff', 'new_value': '#ff0000'}),
+        ('style_changed', {'key': 'dashed', 'old_value': None, 'new_value': '1'}),
+        ('styles_changed', {
+            'old_values': {'fillColor': '#ffffff', 'strokeColor': '#000000', 'dashed': None},
+            'new_values': {'fillColor': '#ff0000', 'strokeColor': '#000000', 'dashed': '1'},
+        }),
+    ]